@@ -8,7 +8,9 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import os
 import sys
+from collections.abc import Callable, Coroutine, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -21,6 +23,9 @@ def app(argv: list[str] | None = None) -> None:
 
 
 def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
     parser = argparse.ArgumentParser(
         prog="edgarpack",
         description="llms.txt for SEC filings — build deterministic markdown packs.",
@@ -34,6 +39,36 @@ def main(argv: list[str] | None = None) -> int:
 
     sub = parser.add_subparsers(dest="cmd", required=True)
 
+    # Only materialize the selected subcommand's parser; help and unknown commands
+    # still need every subcommand registered so argparse can list/reject them.
+    selected = _selected_subcommand(argv)
+    if selected is not None:
+        _SUBCOMMANDS[selected][0](sub)
+    else:
+        for add_parser, _ in _SUBCOMMANDS.values():
+            add_parser(sub)
+
+    args = parser.parse_args(argv)
+
+    if args.cmd in _SUBCOMMANDS:
+        return _SUBCOMMANDS[args.cmd][1](args)
+
+    parser.print_help()
+    return 2
+
+
+def _selected_subcommand(argv: list[str]) -> str | None:
+    """Return the subcommand named in argv (first non-flag token), if known."""
+    for token in argv:
+        if token in {"-h", "--help"}:
+            return None
+        if token.startswith("-"):
+            continue
+        return token if token in _SUBCOMMANDS else None
+    return None
+
+
+def _add_build_parser(sub: Any) -> None:
     p_build = sub.add_parser("build", help="Build a filing pack")
     p_build.add_argument(
         "--cik",
@@ -73,7 +108,14 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Bypass cache and rebuild",
     )
+    p_build.add_argument(
+        "--approximate-tokens",
+        action="store_true",
+        help="Estimate token counts instead of running tiktoken (faster)",
+    )
+
 
+def _add_company_llms_parser(sub: Any) -> None:
     p_company = sub.add_parser("company-llms", help="Generate company-level llms.txt")
     p_company.add_argument("--cik", "-c", required=True, help="CIK number")
     p_company.add_argument(
@@ -84,14 +126,20 @@ def main(argv: list[str] | None = None) -> int:
         help="Packs output directory",
     )
 
+
+def _add_list_parser(sub: Any) -> None:
     p_list = sub.add_parser("list", help="List recent filings for a company")
     p_list.add_argument("--cik", "-c", required=True, help="CIK number")
     p_list.add_argument("--form", "-f", help="Filter by form type")
     p_list.add_argument("--limit", "-n", type=int, default=10, help="Number of filings to show")
 
+
+def _add_cache_parser(sub: Any) -> None:
     p_cache = sub.add_parser("cache", help="Show cache info or clear cache")
     p_cache.add_argument("--clear", action="store_true", help="Clear the cache")
 
+
+def _add_site_parser(sub: Any) -> None:
     p_site = sub.add_parser("site", help="Generate a minimal static site from packs")
     p_site.add_argument(
         "--packs",
@@ -108,21 +156,19 @@ def main(argv: list[str] | None = None) -> int:
     )
     p_site.add_argument("--base-url", default=None, help="Optional base URL (reserved)")
 
-    args = parser.parse_args(argv)
 
-    if args.cmd == "build":
-        return _cmd_build(args)
-    if args.cmd == "company-llms":
-        return _cmd_company_llms(args)
-    if args.cmd == "list":
-        return _cmd_list(args)
-    if args.cmd == "cache":
-        return _cmd_cache(args)
-    if args.cmd == "site":
-        return _cmd_site(args)
+def _run_with_client(main: Coroutine[Any, Any, int]) -> int:
+    """Run a command's coroutine, closing the shared SEC client when it ends."""
 
-    parser.print_help()
-    return 2
+    async def _run() -> int:
+        from .sec.client import close_client
+
+        try:
+            return await main
+        finally:
+            await close_client()
+
+    return asyncio.run(_run())
 
 
 def _cmd_build(args: Any) -> int:
@@ -142,6 +188,7 @@ def _cmd_build(args: Any) -> int:
                 with_chunks=bool(args.with_chunks),
                 with_xbrl=bool(args.with_xbrl),
                 force=bool(args.force),
+                approximate_tokens=bool(args.approximate_tokens),
             )
         except Exception as e:
             print(f"Error: {e}", file=sys.stderr)
@@ -164,7 +211,7 @@ def _cmd_build(args: Any) -> int:
 
         return 0
 
-    return asyncio.run(_run())
+    return _run_with_client(_run())
 
 
 def _cmd_company_llms(args: Any) -> int:
@@ -180,7 +227,7 @@ def _cmd_company_llms(args: Any) -> int:
         print(f"✓ Company llms.txt written: {path}")
         return 0
 
-    return asyncio.run(_run())
+    return _run_with_client(_run())
 
 
 def _cmd_list(args: Any) -> int:
@@ -202,14 +249,14 @@ def _cmd_list(args: Any) -> int:
             print(f"  {f.form_type:8} {f.filing_date}  {f.accession}")
         return 0
 
-    return asyncio.run(_run())
+    return _run_with_client(_run())
 
 
 def _cmd_cache(args: Any) -> int:
     from .config import CACHE_DIR
-    from .sec.cache import DiskCache
+    from .sec.cache import get_cache
 
-    cache = DiskCache(CACHE_DIR)
+    cache = get_cache(CACHE_DIR)
     cache_dir = cache.cache_dir
 
     if not cache_dir.exists():
@@ -229,10 +276,13 @@ def _cmd_cache(args: Any) -> int:
 
     total_size = 0
     file_count = 0
-    for f in cache_dir.rglob("*"):
-        if f.is_file():
-            total_size += f.stat().st_size
-            file_count += 1
+    for entry in _scandir_files(cache_dir):
+        try:
+            total_size += entry.stat(follow_symlinks=False).st_size
+        except FileNotFoundError:
+            # Entry removed between listing and stat (e.g. concurrent cache clear).
+            continue
+        file_count += 1
 
     size_mb = total_size / (1024 * 1024)
     print(f"Cache directory: {cache_dir}")
@@ -241,6 +291,22 @@ def _cmd_cache(args: Any) -> int:
     return 0
 
 
+def _scandir_files(path: Path | str) -> Iterator[os.DirEntry[str]]:
+    """Yield regular files under path recursively, reusing scandir's cached entry types."""
+    try:
+        it = os.scandir(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+    with it:
+        for entry in it:
+            if entry.is_symlink():
+                continue
+            if entry.is_file(follow_symlinks=False):
+                yield entry
+            elif entry.is_dir(follow_symlinks=False):
+                yield from _scandir_files(entry.path)
+
+
 def _cmd_site(args: Any) -> int:
     from .site.build import build_site
 
@@ -254,5 +320,15 @@ def _cmd_site(args: Any) -> int:
     return 0
 
 
+# Subcommand name -> (parser builder, handler). Order determines `--help` listing.
+_SUBCOMMANDS: dict[str, tuple[Callable[[Any], None], Callable[[Any], int]]] = {
+    "build": (_add_build_parser, _cmd_build),
+    "company-llms": (_add_company_llms_parser, _cmd_company_llms),
+    "list": (_add_list_parser, _cmd_list),
+    "cache": (_add_cache_parser, _cmd_cache),
+    "site": (_add_site_parser, _cmd_site),
+}
+
+
 if __name__ == "__main__":
     app()
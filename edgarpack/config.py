@@ -26,6 +26,8 @@ SEC_ARCHIVES_BASE = "https://www.sec.gov/Archives/edgar/data"
 CONNECT_TIMEOUT = 30.0
 READ_TIMEOUT = 60.0
 MAX_RETRIES = 3
+# Idle kept-alive connections pooled per host (extra ones are closed when returned)
+MAX_IDLE_CONNECTIONS_PER_HOST = 4
 
 # Token counting model
 TIKTOKEN_ENCODING = "cl100k_base"
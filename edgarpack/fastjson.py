@@ -0,0 +1,54 @@
+"""JSON serialization with an optional orjson fast path.
+
+orjson is not a required dependency. `dumps_sorted` always produces the bytes of
+the standard library encoder (sorted keys, two-space indent); orjson is used only
+for payloads where its output is known to be identical, so pack output does not
+depend on whether the `fast` extra is installed.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - environment-dependent
+    orjson = None  # type: ignore
+
+# orjson writes exponent floats as 1e-7/1e16 where the stdlib writes 1e-07/1e+16.
+# A digit followed by "e" may also be inside a string (e.g. a hex digest); such
+# payloads simply take the stdlib path.
+_EXPONENT_PATTERN = re.compile(rb"\d[eE]")
+
+
+def has_orjson() -> bool:
+    """Return True when the orjson fast path is available."""
+    return orjson is not None
+
+
+def dumps_sorted(obj: Any, ensure_ascii: bool = False) -> bytes:
+    """Serialize obj as indented JSON with sorted keys, encoded as UTF-8.
+
+    The result is byte-identical to `json.dumps(obj, indent=2, sort_keys=True,
+    ensure_ascii=ensure_ascii)` for finite values. orjson output is used only when
+    it contains no exponent floats and, if ensure_ascii is set, no non-ASCII text.
+
+    Args:
+        obj: JSON-compatible object
+        ensure_ascii: Escape non-ASCII characters as \\uXXXX
+
+    Returns:
+        UTF-8 encoded JSON (no trailing newline)
+    """
+    if orjson is not None:
+        try:
+            out = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2)
+        except TypeError:
+            # e.g. integers wider than 64 bits; the stdlib handles these.
+            pass
+        else:
+            if _EXPONENT_PATTERN.search(out) is None and (not ensure_ascii or out.isascii()):
+                return out
+    return json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=ensure_ascii).encode("utf-8")
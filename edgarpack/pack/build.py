@@ -1,32 +1,35 @@
 """Core pack builder orchestrating the full pipeline."""
 
+import asyncio
 import json
 import shutil
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel
-
 from ..config import SEC_ARCHIVES_BASE
-from ..parse.html_clean import clean_html
-from ..parse.ixbrl_strip import strip_ixbrl
-from ..parse.md_render import render_markdown
+from ..fastjson import dumps_sorted
+from ..parse.md_render import parse_filing
 from ..parse.sectionize import sectionize
-from ..parse.semantic_html import reduce_to_semantic
-from ..parse.tokenize import count_tokens, has_tiktoken
+from ..parse.tokenize import count_tokens, estimate_tokens, has_tiktoken
 from ..sec.archives import fetch_filing_html
 from ..sec.submissions import get_filing_by_accession, get_latest_filing
 from ..sec.xbrl import fetch_xbrl_facts
-from .chunks import generate_chunks, write_chunks_ndjson
-from .llms_txt import generate_llms_txt, write_llms_txt
-from .manifest import compute_sha256, create_manifest, write_manifest
-
-
-class PackResult(BaseModel):
+from .chunks import generate_chunks, write_and_hash_chunks
+from .llms_txt import generate_llms_txt
+from .manifest import (
+    create_manifest,
+    read_summary,
+    write_and_hash,
+    write_manifest,
+    write_summary,
+)
+
+
+@dataclass(slots=True)
+class PackResult:
     """Result of building a pack."""
 
-    model_config = {"arbitrary_types_allowed": True}
-
     output_dir: Path
     filing_meta: dict[str, Any]
     sections_count: int
@@ -35,6 +38,74 @@ class PackResult(BaseModel):
     artifacts: list[str]
 
 
+def _decode_html(content: bytes) -> str:
+    """Decode HTML bytes as UTF-8, falling back to latin-1."""
+    try:
+        return content.decode("utf-8")
+    except UnicodeDecodeError:
+        return content.decode("latin-1")
+
+
+def _existing_pack_result(pack_dir: Path, warning: str) -> PackResult | None:
+    """Result for an already-built pack, or None if pack_dir has no manifest."""
+    summary = read_summary(pack_dir)
+    if summary is None:
+        return None
+    return PackResult(
+        output_dir=pack_dir,
+        filing_meta=summary.get("filing", {}),
+        sections_count=summary.get("sections_count", 0),
+        tokens_total=summary.get("tokens_total", 0),
+        warnings=[warning],
+        artifacts=list(summary.get("artifacts", [])),
+    )
+
+
+async def _skipped() -> tuple[str | None, str | None]:
+    """Result of an optional step that was not requested."""
+    return None, None
+
+
+def _write_chunks(sections: list[Any], pack_dir: Path) -> str:
+    """Generate and write chunks.ndjson, returning its SHA256."""
+    return write_and_hash_chunks(generate_chunks(sections), pack_dir)
+
+
+async def _build_chunks(sections: list[Any], pack_dir: Path) -> tuple[str | None, str | None]:
+    """Optional chunks artifact, built off the event loop.
+
+    Returns:
+        (sha256 of chunks.ndjson or None, warning or None)
+    """
+    try:
+        return await asyncio.to_thread(_write_chunks, sections, pack_dir), None
+    except Exception as e:
+        return None, f"Failed to generate chunks: {e}"
+
+
+async def _build_xbrl(
+    cik: str,
+    accession: str,
+    pack_dir: Path,
+    force: bool,
+) -> tuple[str | None, str | None]:
+    """Optional XBRL artifact.
+
+    Returns:
+        (sha256 of xbrl.json or None, warning or None)
+    """
+    try:
+        xbrl_data = await fetch_xbrl_facts(cik, accession, force=force)
+        if not xbrl_data:
+            return None, "No XBRL data available for this filing"
+        optional_dir = pack_dir / "optional"
+        optional_dir.mkdir(exist_ok=True)
+        content = dumps_sorted(xbrl_data, ensure_ascii=True)
+        return write_and_hash(optional_dir / "xbrl.json", content), None
+    except Exception as e:
+        return None, f"Failed to fetch XBRL data: {e}"
+
+
 async def build_pack(
     cik: str,
     accession: str | None = None,
@@ -43,6 +114,7 @@ async def build_pack(
     with_chunks: bool = False,
     with_xbrl: bool = False,
     force: bool = False,
+    approximate_tokens: bool = False,
 ) -> PackResult:
     """Build a complete filing pack.
 
@@ -54,12 +126,13 @@ async def build_pack(
         with_chunks: Generate chunks.ndjson
         with_xbrl: Generate xbrl.json
         force: Bypass cache
+        approximate_tokens: Estimate token counts from character length instead
+            of tokenizing (skips tiktoken entirely)
 
     Returns:
         PackResult with build info
     """
     warnings: list[str] = []
-    artifacts: list[str] = []
 
     # Step 1: Resolve filing metadata
     if accession:
@@ -76,32 +149,18 @@ async def build_pack(
 
     # Check if already exists
     if pack_dir.exists() and not force:
-        manifest_path = pack_dir / "manifest.json"
-        if manifest_path.exists():
-            # Already built, return existing result
-            manifest_data = json.loads(manifest_path.read_text(encoding="utf-8"))
-            return PackResult(
-                output_dir=pack_dir,
-                filing_meta=manifest_data.get("filing", {}),
-                sections_count=len(manifest_data.get("sections", [])),
-                tokens_total=manifest_data.get("tokens_total", 0),
-                warnings=["Pack already exists, use --force to rebuild"],
-                artifacts=list(manifest_data.get("artifacts", {}).keys()),
-            )
+        existing = _existing_pack_result(pack_dir, "Pack already exists, use --force to rebuild")
+        if existing is not None:
+            return existing
 
     # Backward-compatible read: older versions used accession_nodash as directory name.
     if legacy_pack_dir.exists() and not pack_dir.exists() and not force:
-        legacy_manifest = legacy_pack_dir / "manifest.json"
-        if legacy_manifest.exists():
-            manifest_data = json.loads(legacy_manifest.read_text(encoding="utf-8"))
-            return PackResult(
-                output_dir=legacy_pack_dir,
-                filing_meta=manifest_data.get("filing", {}),
-                sections_count=len(manifest_data.get("sections", [])),
-                tokens_total=manifest_data.get("tokens_total", 0),
-                warnings=["Pack already exists (legacy layout), use --force to rebuild"],
-                artifacts=list(manifest_data.get("artifacts", {}).keys()),
-            )
+        existing = _existing_pack_result(
+            legacy_pack_dir,
+            "Pack already exists (legacy layout), use --force to rebuild",
+        )
+        if existing is not None:
+            return existing
 
     if pack_dir.exists() and force:
         shutil.rmtree(pack_dir)
@@ -116,22 +175,18 @@ async def build_pack(
         raise ValueError(f"No HTML files found for filing {meta.accession}")
 
     # Step 4: Process HTML to markdown
-    # Concatenate all HTML files (primary first)
-    combined_parts: list[str] = []
-    for filename, content in html_files:
-        try:
-            decoded = content.decode("utf-8")
-        except UnicodeDecodeError:
-            decoded = content.decode("latin-1")
-        combined_parts.append(decoded)
-    combined_html = "\n".join(combined_parts)
-
-    # Pipeline: strip iXBRL -> clean HTML -> render markdown
-    html_stripped = strip_ixbrl(combined_html)
-    html_cleaned = clean_html(html_stripped)
+    # Concatenate all HTML files (primary first) as bytes and decode once.
+    combined_bytes = b"\n".join(content for _, content in html_files)
+    try:
+        combined_html = combined_bytes.decode("utf-8")
+    except UnicodeDecodeError:
+        # Rare: decode per file so only non-UTF-8 files fall back to latin-1.
+        combined_html = "\n".join(_decode_html(content) for _, content in html_files)
+    del combined_bytes
+
+    # Pipeline: strip iXBRL -> clean HTML -> reduce to semantic HTML -> render markdown
     base_url = f"{SEC_ARCHIVES_BASE}/{meta.cik}/{meta.accession_nodash}/"
-    html_semantic = reduce_to_semantic(html_cleaned, base_url=base_url)
-    markdown = render_markdown(html_semantic)
+    markdown = parse_filing(combined_html, base_url=base_url)
 
     # Step 5: Sectionize
     sections = sectionize(markdown, meta.form_type)
@@ -140,65 +195,57 @@ async def build_pack(
     for section in sections:
         warnings.extend(section.warnings)
 
-    # Step 6: Write full filing markdown
-    full_md_path = pack_dir / "filing.full.md"
-    full_md_path.write_text(markdown, encoding="utf-8")
-    artifacts.append("filing.full.md")
+    # Step 6-7: Write full filing markdown and section files.
+    # Writes are independent I/O, so run them concurrently off the event loop.
+    # Artifacts are hashed as they are written (manifest.json itself is excluded).
+    # Batching all files into one worker with raw os.write calls measured no
+    # better than this for typical section counts, so the simple form stays.
+    artifact_hashes: dict[str, str] = {}
+    writes = [("filing.full.md", markdown)]
+    writes.extend((f"sections/{section.id}.md", section.content) for section in sections)
+    hashes = await asyncio.gather(
+        *(asyncio.to_thread(write_and_hash, pack_dir / name, text) for name, text in writes)
+    )
+    for (name, _), digest in zip(writes, hashes, strict=True):
+        artifact_hashes[name] = digest
+
+    # Steps 8-10 are independent: chunking and token counting are local CPU work
+    # while the XBRL fetch is a network round-trip, so run them concurrently.
+    (chunks_hash, chunks_warning), (xbrl_hash, xbrl_warning), tokens_total = await asyncio.gather(
+        _build_chunks(sections, pack_dir) if with_chunks else _skipped(),
+        _build_xbrl(cik, meta.accession, pack_dir, force) if with_xbrl else _skipped(),
+        asyncio.to_thread(estimate_tokens if approximate_tokens else count_tokens, markdown),
+    )
 
-    # Step 7: Write section files
-    for section in sections:
-        section_path = sections_dir / f"{section.id}.md"
-        section_path.write_text(section.content, encoding="utf-8")
-        artifacts.append(f"sections/{section.id}.md")
-
-    # Step 8: Optional - generate chunks
-    if with_chunks:
-        try:
-            chunks = generate_chunks(sections)
-            write_chunks_ndjson(chunks, pack_dir)
-            artifacts.append("optional/chunks.ndjson")
-        except Exception as e:
-            warnings.append(f"Failed to generate chunks: {e}")
-
-    # Step 9: Optional - fetch XBRL
-    if with_xbrl:
-        try:
-            xbrl_data = await fetch_xbrl_facts(cik, meta.accession, force=force)
-            if xbrl_data:
-                optional_dir = pack_dir / "optional"
-                optional_dir.mkdir(exist_ok=True)
-                xbrl_path = optional_dir / "xbrl.json"
-                xbrl_path.write_text(
-                    json.dumps(xbrl_data, indent=2, sort_keys=True),
-                    encoding="utf-8",
-                )
-                artifacts.append("optional/xbrl.json")
-            else:
-                warnings.append("No XBRL data available for this filing")
-        except Exception as e:
-            warnings.append(f"Failed to fetch XBRL data: {e}")
-
-    # Step 10: Calculate total tokens
-    tokens_total = count_tokens(markdown)
-    if not has_tiktoken():
+    # Step 8: Optional - chunks
+    if chunks_hash is not None:
+        artifact_hashes["optional/chunks.ndjson"] = chunks_hash
+    if chunks_warning:
+        warnings.append(chunks_warning)
+
+    # Step 9: Optional - XBRL
+    if xbrl_hash is not None:
+        artifact_hashes["optional/xbrl.json"] = xbrl_hash
+    if xbrl_warning:
+        warnings.append(xbrl_warning)
+
+    # Step 10: Total tokens
+    if approximate_tokens:
+        warnings.append("Token counts are approximate (--approximate-tokens)")
+    elif not has_tiktoken():
         warnings.append("Token counts are approximate (tiktoken not installed)")
 
-    # Step 11: Write llms.txt (needed before hashing artifacts)
+    # Step 11: Write llms.txt (needed before writing the manifest)
     llms_content = generate_llms_txt(
         meta,
         sections,
-        has_chunks=with_chunks and "optional/chunks.ndjson" in artifacts,
-        has_xbrl=with_xbrl and "optional/xbrl.json" in artifacts,
+        has_chunks=with_chunks and "optional/chunks.ndjson" in artifact_hashes,
+        has_xbrl=with_xbrl and "optional/xbrl.json" in artifact_hashes,
     )
-    write_llms_txt(llms_content, pack_dir)
-    artifacts.append("llms.txt")
+    artifact_hashes["llms.txt"] = write_and_hash(pack_dir / "llms.txt", llms_content)
 
-    # Step 12: Compute hashes for all artifacts (excluding manifest.json itself)
-    artifact_hashes: dict[str, str] = {}
-    for artifact in sorted(set(artifacts)):
-        artifact_path = pack_dir / artifact
-        if artifact_path.exists() and artifact != "manifest.json":
-            artifact_hashes[artifact] = compute_sha256(artifact_path.read_bytes())
+    # Step 12: Order artifact hashes deterministically
+    artifact_hashes = dict(sorted(artifact_hashes.items()))
 
     # Step 13: Write manifest (deterministic)
     source_url = f"{SEC_ARCHIVES_BASE}/{meta.cik}/{meta.accession_nodash}/{meta.primary_document}"
@@ -209,9 +256,10 @@ async def build_pack(
         warnings=warnings,
         tokens_total=tokens_total,
         source_url=source_url,
+        approximate=approximate_tokens,
     )
     write_manifest(manifest, pack_dir)
-    artifacts.append("manifest.json")
+    write_summary(manifest, pack_dir)
 
     return PackResult(
         output_dir=pack_dir,
@@ -225,7 +273,7 @@ async def build_pack(
         sections_count=len(sections),
         tokens_total=tokens_total,
         warnings=warnings,
-        artifacts=artifacts,
+        artifacts=[*artifact_hashes, "manifest.json"],
     )
 
 
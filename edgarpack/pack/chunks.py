@@ -1,17 +1,35 @@
 """Generate semantic chunks from sections."""
 
 import hashlib
+import json
 import re
 from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-
-from pydantic import BaseModel
+from typing import Any
 
 from ..config import DEFAULT_CHUNK_MAX_TOKENS, DEFAULT_CHUNK_MIN_TOKENS
-from ..parse.tokenize import count_tokens, has_tiktoken, truncate_to_tokens
+from ..parse.tokenize import (
+    count_tokens,
+    has_tiktoken,
+    token_counter,
+    truncate_to_tokens,
+)
+from .manifest import _sha256
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_PARAGRAPH_PATTERN = re.compile(r"\n\n+")
+_SENTENCE_PATTERN = re.compile(r"[.!?]\s+")
+_BOUNDARY_PATTERN = re.compile(r"[.!?]\s+|\n\n+")
+
+# Compact output with non-ASCII kept as UTF-8 (the original pydantic JSON format).
+_NDJSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
 
 
-class Chunk(BaseModel):
+@dataclass(slots=True)
+class Chunk:
     """A semantic chunk of a section."""
 
     chunk_id: str
@@ -34,8 +52,9 @@ def generate_chunk_id(section_id: str, chunk_index: int, text: str) -> str:
     Returns:
         SHA256-based chunk ID
     """
-    # Normalize text for consistent hashing
-    normalized = re.sub(r"\s+", " ", text.strip().lower())
+    # Normalize text for consistent hashing. chunk_id is the public join key for
+    # chunks.ndjson, so its derivation must not change.
+    normalized = _WHITESPACE_PATTERN.sub(" ", text.strip().lower())
     content = f"{section_id}:{chunk_index}:{normalized}"
     return hashlib.sha256(content.encode()).hexdigest()[:16]
 
@@ -49,10 +68,7 @@ def find_paragraph_boundaries(text: str) -> list[int]:
     Returns:
         List of character positions where paragraphs end
     """
-    boundaries = []
-    for match in re.finditer(r"\n\n+", text):
-        boundaries.append(match.end())
-    return boundaries
+    return [match.end() for match in _PARAGRAPH_PATTERN.finditer(text)]
 
 
 def find_sentence_boundaries(text: str) -> list[int]:
@@ -64,10 +80,32 @@ def find_sentence_boundaries(text: str) -> list[int]:
     Returns:
         List of character positions where sentences end
     """
-    boundaries = []
     # Match sentence-ending punctuation followed by space or newline
-    for match in re.finditer(r"[.!?]\s+", text):
-        boundaries.append(match.end())
+    return [match.end() for match in _SENTENCE_PATTERN.finditer(text)]
+
+
+def find_boundaries(text: str) -> list[int]:
+    """Find paragraph and sentence boundaries in a single scan.
+
+    Equivalent to the sorted union of `find_paragraph_boundaries` and
+    `find_sentence_boundaries`.
+
+    Args:
+        text: Text to analyze
+
+    Returns:
+        Sorted, unique list of character positions where boundaries fall
+    """
+    boundaries: list[int] = []
+    for match in _BOUNDARY_PATTERN.finditer(text):
+        end = match.end()
+        if text[match.start()] in ".!?" and "\n\n" in match.group():
+            # Sentence whitespace swallowed paragraph breaks; they may end earlier
+            # than the sentence boundary (e.g. ".\n\n  Next").
+            for para in _PARAGRAPH_PATTERN.finditer(text, match.start(), end):
+                if para.end() != end:
+                    boundaries.append(para.end())
+        boundaries.append(end)
     return boundaries
 
 
@@ -103,25 +141,24 @@ def chunk_section(
     if min_tokens > max_tokens:
         min_tokens = max_tokens
 
+    # Tokens never outnumber UTF-8 bytes, so short content is a single chunk without
+    # encoding it or scanning for boundaries.
+    if len(content) <= max_tokens and len(content.encode("utf-8")) <= max_tokens:
+        return [_whole_section_chunk(section_id, content, count_tokens(content))]
+
+    # Resolved once per section; the chunk loop below counts tokens per candidate.
+    use_tiktoken = has_tiktoken()
+    count = token_counter()
+
     # If content is small enough, return as single chunk
-    total_tokens = count_tokens(content)
+    total_tokens = count(content)
     if total_tokens <= max_tokens:
-        return [
-            Chunk(
-                chunk_id=generate_chunk_id(section_id, 0, content),
-                section_id=section_id,
-                chunk_index=0,
-                text=content,
-                char_start=0,
-                char_end=len(content),
-                tokens=total_tokens,
-            )
-        ]
+        return [_whole_section_chunk(section_id, content, total_tokens)]
 
     # Find all potential boundaries (sorted, unique, and always include EOF).
-    all_boundaries = sorted(
-        set(find_paragraph_boundaries(content) + find_sentence_boundaries(content) + [len(content)])
-    )
+    all_boundaries = find_boundaries(content)
+    if not all_boundaries or all_boundaries[-1] != len(content):
+        all_boundaries.append(len(content))
 
     start = 0
     chunk_index = 0
@@ -133,7 +170,9 @@ def chunk_section(
         fallback_end: int | None = None
         fallback_tokens: int | None = None
 
-        if has_tiktoken():
+        if use_tiktoken:
+            # truncate_to_tokens encodes only a bounded prefix of the remaining text,
+            # so each chunk costs O(max_tokens) rather than O(len(content)).
             truncated = truncate_to_tokens(content[start:], max_tokens)
             if not truncated:
                 break
@@ -143,16 +182,13 @@ def chunk_section(
                 best_end = all_boundaries[idx]
             else:
                 best_end = max_end
-            text = content[start:best_end]
-            if not text:
-                break
-            best_tokens = count_tokens(text)
+            best_tokens = count(content[start:best_end])
         else:
-            for end in all_boundaries:
-                if end <= start:
-                    continue
+            # Boundaries are sorted; resume just past the chunk start instead of
+            # rescanning from the beginning for every chunk.
+            for end in islice(all_boundaries, bisect_right(all_boundaries, start), None):
                 candidate = content[start:end]
-                candidate_tokens = count_tokens(candidate)
+                candidate_tokens = count(candidate)
                 if candidate_tokens <= max_tokens:
                     if candidate_tokens >= min_tokens:
                         best_end = end
@@ -169,7 +205,7 @@ def chunk_section(
                     best_tokens = fallback_tokens
                 else:
                     best_end = min(n, start + max_tokens * 4)
-                    best_tokens = count_tokens(content[start:best_end])
+                    best_tokens = count(content[start:best_end])
 
         text = content[start:best_end]
         if not text:
@@ -183,7 +219,7 @@ def chunk_section(
                 text=text,
                 char_start=start,
                 char_end=best_end,
-                tokens=best_tokens if best_tokens is not None else count_tokens(text),
+                tokens=best_tokens if best_tokens is not None else count(text),
             )
         )
         chunk_index += 1
@@ -192,52 +228,93 @@ def chunk_section(
     return chunks
 
 
+def _whole_section_chunk(section_id: str, content: str, tokens: int) -> Chunk:
+    """Build the single chunk covering an entire section."""
+    return Chunk(
+        chunk_id=generate_chunk_id(section_id, 0, content),
+        section_id=section_id,
+        chunk_index=0,
+        text=content,
+        char_start=0,
+        char_end=len(content),
+        tokens=tokens,
+    )
+
+
 def generate_chunks(
     sections: list,  # List of Section objects
     min_tokens: int = DEFAULT_CHUNK_MIN_TOKENS,
     max_tokens: int = DEFAULT_CHUNK_MAX_TOKENS,
-) -> list[Chunk]:
-    """Generate chunks for all sections.
+) -> Iterator[Chunk]:
+    """Generate chunks for all sections, lazily and in section order.
 
     Args:
         sections: List of Section objects
         min_tokens: Minimum tokens per chunk
         max_tokens: Maximum tokens per chunk
 
-    Returns:
-        List of all Chunk objects
+    Yields:
+        Chunk objects, one section at a time
     """
-    all_chunks: list[Chunk] = []
-
     for section in sections:
-        section_chunks = chunk_section(
+        yield from chunk_section(
             section.id,
             section.content,
             min_tokens=min_tokens,
             max_tokens=max_tokens,
         )
-        all_chunks.extend(section_chunks)
-
-    return all_chunks
 
 
-def write_chunks_ndjson(chunks: list[Chunk], output_dir: Path) -> Path:
+def write_chunks_ndjson(chunks: Iterable[Chunk], output_dir: Path) -> Path:
     """Write chunks to ndjson file.
 
+    Lines are written as chunks arrive, so a generator is never materialized.
+
     Args:
-        chunks: List of Chunk objects
+        chunks: Chunk objects (any iterable, e.g. from generate_chunks)
         output_dir: Directory to write to
 
     Returns:
         Path to written file
     """
+    write_and_hash_chunks(chunks, output_dir)
+    return output_dir / "optional" / "chunks.ndjson"
+
+
+def write_and_hash_chunks(chunks: Iterable[Chunk], output_dir: Path) -> str:
+    """Write chunks to optional/chunks.ndjson and return the file's SHA256.
+
+    The hash is updated with each line as it is written, so the file never has
+    to be read back.
+
+    Args:
+        chunks: Chunk objects (any iterable, e.g. from generate_chunks)
+        output_dir: Directory to write to
+
+    Returns:
+        Hex-encoded SHA256 hash of the written bytes
+    """
     optional_dir = output_dir / "optional"
     optional_dir.mkdir(exist_ok=True)
 
-    path = optional_dir / "chunks.ndjson"
-
-    with path.open("w", encoding="utf-8") as f:
+    encode = _NDJSON_ENCODER.encode
+    digest = _sha256()
+    with (optional_dir / "chunks.ndjson").open("wb") as f:
         for chunk in chunks:
-            f.write(chunk.model_dump_json() + "\n")
-
-    return path
+            line = (encode(_chunk_record(chunk)) + "\n").encode("utf-8")
+            digest.update(line)
+            f.write(line)
+    return digest.hexdigest()
+
+
+def _chunk_record(chunk: Chunk) -> dict[str, Any]:
+    """Plain dict for a chunk, in field order."""
+    return {
+        "chunk_id": chunk.chunk_id,
+        "section_id": chunk.section_id,
+        "chunk_index": chunk.chunk_index,
+        "text": chunk.text,
+        "char_start": chunk.char_start,
+        "char_end": chunk.char_end,
+        "tokens": chunk.tokens,
+    }
@@ -1,8 +1,15 @@
 """Generate llms.txt files for filings and companies."""
 
+import json
+import os
+import re
 from pathlib import Path
 from typing import Any
 
+# Locates the top-level "filing" key; it precedes the (large) sections list in manifests.
+_FILING_KEY_PATTERN = re.compile(r'"filing"\s*:\s*')
+_JSON_DECODER = json.JSONDecoder()
+
 
 def generate_llms_txt(
     filing_meta: Any,  # FilingMeta
@@ -21,36 +28,29 @@ def generate_llms_txt(
     Returns:
         llms.txt content as string
     """
-    lines = []
-
-    # Header
-    lines.append(
+    lines = [
+        # Header
         f"# {filing_meta.company_name} {filing_meta.form_type} "
-        f"({filing_meta.filing_date.isoformat()})"
-    )
-    lines.append("")
-    lines.append(f"> CIK: {filing_meta.cik} | Accession: {filing_meta.accession}")
-    lines.append("")
-
-    # Filing Pack section
-    lines.append("## Filing Pack")
-    lines.append("")
-    lines.append("- [Full Filing](filing.full.md)")
-    lines.append("- [Manifest](manifest.json)")
-    lines.append("")
-
-    # Sections
-    lines.append("## Sections")
-    lines.append("")
-    for section in sections:
-        section_path = f"sections/{section.id}.md"
-        lines.append(f"- [{section.title}]({section_path})")
+        f"({filing_meta.filing_date.isoformat()})",
+        "",
+        f"> CIK: {filing_meta.cik} | Accession: {filing_meta.accession}",
+        "",
+        # Filing Pack section
+        "## Filing Pack",
+        "",
+        "- [Full Filing](filing.full.md)",
+        "- [Manifest](manifest.json)",
+        "",
+        # Sections
+        "## Sections",
+        "",
+    ]
+    lines.extend([f"- [{section.title}](sections/{section.id}.md)" for section in sections])
     lines.append("")
 
     # Optional artifacts
     if has_chunks or has_xbrl:
-        lines.append("## Optional")
-        lines.append("")
+        lines.extend(("## Optional", ""))
         if has_chunks:
             lines.append("- [Chunks](optional/chunks.ndjson)")
         if has_xbrl:
@@ -78,25 +78,23 @@ def generate_company_llms_txt(
     Returns:
         llms.txt content as string
     """
-    lines = []
-
-    # Header
-    lines.append(f"# {company_name} SEC Filings")
-    lines.append("")
-    lines.append(f"> CIK: {cik}")
-    lines.append("")
-
-    # Recent Filings
-    lines.append("## Recent Filings")
-    lines.append("")
-
-    for filing in filings:
-        form_type = filing.get("form_type", "Unknown")
-        filing_date = filing.get("filing_date", "Unknown")
-        accession = filing.get("accession", "")
-
-        lines.append(f"- [{form_type} {filing_date}]({accession}/llms.txt)")
-
+    lines = [
+        # Header
+        f"# {company_name} SEC Filings",
+        "",
+        f"> CIK: {cik}",
+        "",
+        # Recent Filings
+        "## Recent Filings",
+        "",
+    ]
+    lines.extend(
+        [
+            f"- [{filing.get('form_type', 'Unknown')} {filing.get('filing_date', 'Unknown')}]"
+            f"({filing.get('accession', '')}/llms.txt)"
+            for filing in filings
+        ]
+    )
     lines.append("")
 
     return "\n".join(lines)
@@ -128,31 +126,46 @@ def scan_filings_for_company_llms(cik_dir: Path) -> list[dict[str, Any]]:
     """
     filings = []
 
-    for subdir in cik_dir.iterdir():
-        if not subdir.is_dir():
-            continue
-
-        manifest_path = subdir / "manifest.json"
-        if not manifest_path.exists():
-            continue
+    with os.scandir(cik_dir) as it:
+        entries = [e for e in it if e.is_dir(follow_symlinks=False)]
 
+    for entry in entries:
+        manifest_path = Path(entry.path) / "manifest.json"
         try:
-            import json
-
-            manifest = json.loads(manifest_path.read_text())
-            filing_info = manifest.get("filing", {})
+            filing_info = _read_manifest_filing(manifest_path)
 
             filings.append(
                 {
                     "form_type": filing_info.get("form_type", "Unknown"),
                     "filing_date": filing_info.get("filing_date", "Unknown"),
-                    "accession": subdir.name,
+                    "accession": entry.name,
                 }
             )
         except Exception:
+            # Missing manifest (not a pack dir) or unreadable JSON.
             continue
 
     # Sort by date, newest first
     filings.sort(key=lambda f: f.get("filing_date", ""), reverse=True)
 
     return filings
+
+
+def _read_manifest_filing(manifest_path: Path) -> dict[str, Any]:
+    """Read only the `filing` block of a manifest.json.
+
+    Decodes the single object following the "filing" key instead of the whole
+    manifest, falling back to a full parse if the fast path fails.
+    """
+    text = manifest_path.read_text()
+    match = _FILING_KEY_PATTERN.search(text)
+    if match:
+        try:
+            filing, _ = _JSON_DECODER.raw_decode(text, match.end())
+        except ValueError:
+            filing = None
+        if isinstance(filing, dict):
+            return filing
+    manifest = json.loads(text)
+    filing = manifest.get("filing", {})
+    return filing if isinstance(filing, dict) else {}
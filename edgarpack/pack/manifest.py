@@ -2,13 +2,18 @@
 
 import hashlib
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel
 
 from ..config import PARSER_VERSION, SCHEMA_VERSION
+from ..fastjson import dumps_sorted
+from ..parse.tokenize import count_tokens, estimate_tokens
 
 
 class SourceInfo(BaseModel):
@@ -28,6 +33,8 @@ class FilingInfo(BaseModel):
     company_name: str
 
 
+# Kept as a pydantic model (part of the public pack API): with pydantic v2 a
+# SectionInfo costs ~1.3 us to build versus ~1.1 us for a slotted dataclass.
 class SectionInfo(BaseModel):
     """Section metadata in manifest."""
 
@@ -65,7 +72,65 @@ def compute_sha256(content: bytes | str) -> str:
     """
     if isinstance(content, str):
         content = content.encode("utf-8")
-    return hashlib.sha256(content).hexdigest()
+    return _sha256(content).hexdigest()
+
+
+def compute_file_sha256(path: Path) -> str:
+    """Compute SHA256 hash of a file without loading it into memory.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex-encoded SHA256 hash
+    """
+    with path.open("rb") as f:
+        # Reads and hashes in a C loop, releasing the GIL while hashing.
+        return hashlib.file_digest(f, _sha256).hexdigest()
+
+
+def _sha256(data: bytes = b"") -> Any:
+    """SHA256 hasher for content integrity (not a security boundary).
+
+    usedforsecurity=False lets FIPS-restricted OpenSSL builds provide the digest;
+    OpenSSL picks SHA-NI / ARMv8 crypto instructions where the CPU has them.
+    """
+    return hashlib.sha256(data, usedforsecurity=False)
+
+
+def write_and_hash(path: Path, content: bytes | str, chunk_size: int = 1 << 20) -> str:
+    """Write content to a file (text as UTF-8) and return its SHA256.
+
+    The hash is updated with each block as it is written, so the file never has
+    to be read back.
+
+    Args:
+        path: File to write
+        content: Bytes or text content
+        chunk_size: Number of characters (or bytes) written per block
+
+    Returns:
+        Hex-encoded SHA256 hash of the written bytes
+    """
+    digest = _sha256()
+    with path.open("wb") as f:
+        for i in range(0, len(content), chunk_size):
+            block = content[i : i + chunk_size]
+            if isinstance(block, str):
+                block = block.encode("utf-8")
+            digest.update(block)
+            f.write(block)
+    return digest.hexdigest()
+
+
+def _hash_and_count(
+    content: str, section_hash: str | None, approximate: bool = False
+) -> tuple[str, int]:
+    """SHA256 (unless already known) and token count of a section's content."""
+    if section_hash is None:
+        section_hash = compute_sha256(content)
+    count = estimate_tokens if approximate else count_tokens
+    return section_hash, count(content)
 
 
 def create_manifest(
@@ -75,35 +140,51 @@ def create_manifest(
     warnings: list[str],
     tokens_total: int,
     source_url: str,
+    approximate: bool = False,
 ) -> Manifest:
     """Create a manifest for a filing pack.
 
     Args:
         filing_meta: Filing metadata from SEC
         sections: List of sections with content
-        artifacts: Map of artifact paths to SHA256 hashes
+        artifacts: Map of artifact paths to SHA256 hashes; hashes recorded for
+            section files (e.g. by write_and_hash) are reused, not recomputed
         warnings: List of warning messages
         tokens_total: Total token count
         source_url: URL of the filing
+        approximate: Estimate section token counts from character length
+            instead of tokenizing (much faster with tiktoken installed)
 
     Returns:
         Populated Manifest object
     """
-    from ..parse.tokenize import count_tokens
+    # Hashing (and tiktoken encoding) release the GIL, so sections are processed
+    # in parallel; map() keeps results in section order.
+    contents = [section.content for section in sections]
+    paths = [f"sections/{section.id}.md" for section in sections]
+    known_hashes = [artifacts.get(path) for path in paths]
+    hash_and_count = partial(_hash_and_count, approximate=approximate)
+    workers = min(len(contents), os.cpu_count() or 1)
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            digests = list(executor.map(hash_and_count, contents, known_hashes))
+    else:
+        digests = list(map(hash_and_count, contents, known_hashes))
 
+    # Inputs come from sectionize and validated FilingMeta, so the nested models
+    # are built with model_construct (no per-field validation).
     section_infos = []
-    for section in sections:
-        section_path = f"sections/{section.id}.md"
-        section_hash = compute_sha256(section.content)
-
+    for section, section_path, (section_hash, tokens) in zip(
+        sections, paths, digests, strict=True
+    ):
         section_infos.append(
-            SectionInfo(
+            SectionInfo.model_construct(
                 id=section.id,
                 title=section.title,
                 path=section_path,
                 char_start=section.char_start,
                 char_end=section.char_end,
-                tokens_approx=count_tokens(section.content),
+                tokens_approx=tokens,
                 sha256=section_hash,
             )
         )
@@ -118,11 +199,11 @@ def create_manifest(
 
     return Manifest(
         generated_at=stable_at,
-        source=SourceInfo(
+        source=SourceInfo.model_construct(
             url=source_url,
             fetched_at=stable_at,
         ),
-        filing=FilingInfo(
+        filing=FilingInfo.model_construct(
             cik=filing_meta.cik,
             accession=filing_meta.accession,
             form_type=filing_meta.form_type,
@@ -148,8 +229,77 @@ def write_manifest(manifest: Manifest, output_dir: Path) -> Path:
     """
     manifest_path = output_dir / "manifest.json"
     payload = manifest.model_dump(mode="json")
-    manifest_path.write_text(
-        json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=False) + "\n",
-        encoding="utf-8",
-    )
+    # Sorted keys are part of the pack format (existing packs are byte-stable per
+    # parser version); sorting costs ~10 us per manifest, so it stays.
+    manifest_path.write_bytes(dumps_sorted(payload) + b"\n")
     return manifest_path
+
+
+def write_summary(manifest: Manifest, output_dir: Path) -> Path:
+    """Write summary.json, a small sidecar with the manifest's headline fields.
+
+    Lets an existing pack be recognized without parsing the full manifest. The
+    summary is derived data: it is not hashed or listed in the manifest's
+    artifacts, so it records the size and mtime of manifest.json and is only
+    trusted while those still match. Call it after write_manifest.
+
+    Args:
+        manifest: Manifest object
+        output_dir: Directory to write to
+
+    Returns:
+        Path to written summary file
+    """
+    summary_path = output_dir / "summary.json"
+    manifest_stat = (output_dir / "manifest.json").stat()
+    payload = {
+        "filing": manifest.filing.model_dump(mode="json"),
+        "manifest_mtime_ns": manifest_stat.st_mtime_ns,
+        "manifest_size": manifest_stat.st_size,
+        "sections_count": len(manifest.sections),
+        "tokens_total": manifest.tokens_total,
+        "artifacts": list(manifest.artifacts),
+    }
+    summary_path.write_bytes(dumps_sorted(payload) + b"\n")
+    return summary_path
+
+
+def read_summary(pack_dir: Path) -> dict[str, Any] | None:
+    """Read the headline fields of an existing pack.
+
+    manifest.json stays the source of truth: summary.json is used only when it
+    records the size and mtime of the manifest currently on disk, which costs a
+    stat rather than a read. Otherwise (missing, stale, edited, or written before
+    the sidecar existed) the fields are read from manifest.json.
+
+    Args:
+        pack_dir: Pack directory
+
+    Returns:
+        Dict with filing, sections_count, tokens_total and artifacts, or None if
+        the directory holds no manifest
+    """
+    manifest_path = pack_dir / "manifest.json"
+    try:
+        manifest_stat = manifest_path.stat()
+    except OSError:
+        return None
+
+    try:
+        summary = json.loads((pack_dir / "summary.json").read_bytes())
+    except (OSError, ValueError):
+        summary = None
+    if (
+        isinstance(summary, dict)
+        and summary.get("manifest_size") == manifest_stat.st_size
+        and summary.get("manifest_mtime_ns") == manifest_stat.st_mtime_ns
+    ):
+        return summary
+
+    manifest_data = json.loads(manifest_path.read_bytes())
+    return {
+        "filing": manifest_data.get("filing", {}),
+        "sections_count": len(manifest_data.get("sections", [])),
+        "tokens_total": manifest_data.get("tokens_total", 0),
+        "artifacts": list(manifest_data.get("artifacts", {}).keys()),
+    }
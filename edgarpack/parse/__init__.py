@@ -2,17 +2,20 @@
 
 from .html_clean import clean_html
 from .ixbrl_strip import strip_ixbrl
-from .md_render import render_markdown
+from .md_render import parse_filing, render_markdown
 from .sectionize import Section, sectionize
-from .semantic_html import reduce_to_semantic
-from .tokenize import count_tokens
+from .semantic_html import reduce_to_semantic, simplify_html
+from .tokenize import count_tokens, count_tokens_batch
 
 __all__ = [
     "clean_html",
     "strip_ixbrl",
     "reduce_to_semantic",
+    "simplify_html",
     "render_markdown",
+    "parse_filing",
     "Section",
     "sectionize",
     "count_tokens",
+    "count_tokens_batch",
 ]
@@ -1,6 +1,7 @@
 """Strip iXBRL tags and namespaces from HTML."""
 
 import re
+from functools import lru_cache
 
 # iXBRL namespace prefixes
 IXBRL_PREFIXES = [
@@ -29,8 +30,32 @@ XMLNS_PREFIX_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+_DOUBLE_SPACE_PATTERN = re.compile(r"  +")
 
-def _build_ixbrl_tag_pattern(prefixes: set[str]) -> re.Pattern[str]:
+# Gate for the fast path: anything the passes below could remove needs either a
+# tag opening with a known prefix or an xmlns declaration (declared prefixes
+# require one too). Searching case-insensitively avoids casefolding a copy of the
+# whole document, and stops at the first hit, which for iXBRL filings is the
+# xmlns declaration on the root element.
+_XMLNS_WORD_PATTERN = re.compile(r"xmlns", re.IGNORECASE)
+_IXBRL_TAG_START_PATTERN = re.compile(
+    r"</?(?:" + "|".join(re.escape(p) for p in IXBRL_PREFIXES) + r")",
+    re.IGNORECASE,
+)
+
+
+def collect_ixbrl_prefixes(html: str) -> set[str]:
+    """Return the known iXBRL prefixes plus any declared for XBRL-style namespaces."""
+    prefixes = set(IXBRL_PREFIXES)
+    for match in XMLNS_PREFIX_PATTERN.finditer(html):
+        prefixes.add(f"{match.group(1)}:")
+    return prefixes
+
+
+@lru_cache(maxsize=64)
+def _build_ixbrl_tag_pattern(prefixes: frozenset[str]) -> re.Pattern[str]:
+    # Most filings declare only the default prefixes, so the pattern is usually
+    # built once per process rather than per document.
     escaped = [re.escape(p) for p in sorted(prefixes)]
     return re.compile(r"</?(?:" + "|".join(escaped) + r")[^>]*>", re.IGNORECASE | re.DOTALL)
 
@@ -47,11 +72,21 @@ def strip_ixbrl(html: str) -> str:
     Returns:
         HTML with iXBRL elements removed
     """
-    prefixes = set(IXBRL_PREFIXES)
-    for match in XMLNS_PREFIX_PATTERN.finditer(html):
-        prefixes.add(f"{match.group(1)}:")
+    # Plain HTML filings have no iXBRL tags or namespace declarations, so only the
+    # double-space collapse applies.
+    if (
+        _XMLNS_WORD_PATTERN.search(html) is None
+        and _IXBRL_TAG_START_PATTERN.search(html) is None
+    ):
+        return _DOUBLE_SPACE_PATTERN.sub(" ", html)
+
+    # The three passes are kept separate on purpose: tag removal must run before
+    # the double-space collapse (removed tags join surrounding spaces), and a
+    # single combined alternation measured slower than the separate patterns
+    # because it defeats the regex engine's fast scan for each pattern's start.
+    prefixes = collect_ixbrl_prefixes(html)
     if prefixes:
-        pattern = _build_ixbrl_tag_pattern(prefixes)
+        pattern = _build_ixbrl_tag_pattern(frozenset(prefixes))
         # First pass: use regex to remove iXBRL tags while preserving content
         # This handles nested iXBRL tags correctly
         result = pattern.sub("", html)
@@ -62,7 +97,7 @@ def strip_ixbrl(html: str) -> str:
     result = XMLNS_PATTERN.sub("", result)
 
     # Clean up any double spaces left behind
-    result = re.sub(r"  +", " ", result)
+    result = _DOUBLE_SPACE_PATTERN.sub(" ", result)
 
     return result
 
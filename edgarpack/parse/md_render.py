@@ -3,6 +3,39 @@
 import re
 from html import unescape
 
+from .semantic_html import simplify_html
+
+_BODY_PATTERN = re.compile(r"<body[^>]*>(.*?)</body>", re.DOTALL | re.IGNORECASE)
+_BETWEEN_TAGS_PATTERN = re.compile(r">\s*<")
+_HEADING_PATTERNS = [
+    re.compile(rf"<h{level}[^>]*>(.*?)</h{level}>", re.DOTALL | re.IGNORECASE)
+    for level in range(1, 7)
+]
+_PRE_PATTERN = re.compile(r"<pre[^>]*>(.*?)</pre>", re.DOTALL | re.IGNORECASE)
+_CODE_PATTERN = re.compile(r"<code[^>]*>(.*?)</code>", re.DOTALL | re.IGNORECASE)
+_BLOCKQUOTE_PATTERN = re.compile(r"<blockquote[^>]*>(.*?)</blockquote>", re.DOTALL | re.IGNORECASE)
+_LINK_PATTERN = re.compile(
+    r'<a[^>]*href=["\']([^"\']*)["\'][^>]*>(.*?)</a>', re.DOTALL | re.IGNORECASE
+)
+_STRONG_PATTERN = re.compile(r"<(?:strong|b)[^>]*>(.*?)</(?:strong|b)>", re.DOTALL | re.IGNORECASE)
+_EM_PATTERN = re.compile(r"<(?:em|i)[^>]*>(.*?)</(?:em|i)>", re.DOTALL | re.IGNORECASE)
+_PARAGRAPH_PATTERN = re.compile(r"<p[^>]*>(.*?)</p>", re.DOTALL | re.IGNORECASE)
+_BR_PATTERN = re.compile(r"<br\s*/?>", re.IGNORECASE)
+_HR_PATTERN = re.compile(r"<hr\s*/?>", re.IGNORECASE)
+_BLOCK_CLOSE_PATTERN = re.compile(
+    r"</(?:div|section|article|main|header|footer|nav|tr|td|th|tbody|thead|tfoot|dl|dt|dd)\s*>",
+    re.IGNORECASE,
+)
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+_UL_PATTERN = re.compile(r"<ul[^>]*>(.*?)</ul>", re.DOTALL | re.IGNORECASE)
+_OL_PATTERN = re.compile(r"<ol[^>]*>(.*?)</ol>", re.DOTALL | re.IGNORECASE)
+_LI_PATTERN = re.compile(r"<li[^>]*>(.*?)</li>", re.DOTALL | re.IGNORECASE)
+_TABLE_PATTERN = re.compile(r"<table[^>]*>(.*?)</table>", re.DOTALL | re.IGNORECASE)
+_TR_PATTERN = re.compile(r"<tr[^>]*>(.*?)</tr>", re.DOTALL | re.IGNORECASE)
+_TH_PATTERN = re.compile(r"<th[^>]*>(.*?)</th>", re.DOTALL | re.IGNORECASE)
+_TD_PATTERN = re.compile(r"<td[^>]*>(.*?)</td>", re.DOTALL | re.IGNORECASE)
+_BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+
 
 def render_markdown(html: str) -> str:
     """Convert semantic HTML to CommonMark markdown.
@@ -22,103 +55,106 @@ def render_markdown(html: str) -> str:
     result = html
 
     # First, extract body content if present
-    body_match = re.search(r"<body[^>]*>(.*?)</body>", result, re.DOTALL | re.IGNORECASE)
+    body_match = _BODY_PATTERN.search(result)
     if body_match:
         result = body_match.group(1)
 
     # Prevent word concatenation when tags are later stripped.
     # (Use space, not newline, to avoid injecting hard line breaks in inline contexts.)
-    result = re.sub(r">\s*<", "> <", result)
+    result = _BETWEEN_TAGS_PATTERN.sub("> <", result)
+
+    # Every pass below needs its opening (and closing) tag to match. Filings
+    # typically use only a few of these tags, so check for each one up front
+    # (case-insensitively, like the patterns) and skip passes that cannot match.
+    # Requiring the closing tag also avoids the non-greedy `(.*?)</x>` scanning to
+    # the end of the document from every opener when no closer exists, which is
+    # quadratic (e.g. `<b[^>]*>` also matches every `<br>`).
+    present = result.casefold()
 
     # Process tables first (complex structure)
-    result = _process_tables(result)
+    if "<table" in present and "</table>" in present:
+        result = _process_tables(result)
 
     # Process headings
-    for level in range(1, 7):
-        pattern = rf"<h{level}[^>]*>(.*?)</h{level}>"
-        result = re.sub(
-            pattern,
+    for level, pattern in enumerate(_HEADING_PATTERNS, start=1):
+        if f"<h{level}" not in present or f"</h{level}>" not in present:
+            continue
+        result = pattern.sub(
             lambda m: f"\n\n{'#' * level} {_strip_tags(m.group(1)).strip()}\n\n",
             result,
-            flags=re.DOTALL | re.IGNORECASE,
         )
 
     # Process code blocks (pre) before inline code
-    result = re.sub(
-        r"<pre[^>]*>(.*?)</pre>",
-        lambda m: f"\n\n```\n{unescape(_strip_tags(m.group(1)))}\n```\n\n",
-        result,
-        flags=re.DOTALL | re.IGNORECASE,
-    )
+    if "<pre" in present and "</pre>" in present:
+        result = _PRE_PATTERN.sub(
+            lambda m: f"\n\n```\n{unescape(_strip_tags(m.group(1)))}\n```\n\n",
+            result,
+        )
+        # Unescaping code block text can introduce new tags; look again.
+        present = result.casefold()
 
     # Process inline code
-    result = re.sub(
-        r"<code[^>]*>(.*?)</code>",
-        lambda m: f"`{_strip_tags(m.group(1)).strip()}`",
-        result,
-        flags=re.DOTALL | re.IGNORECASE,
-    )
+    if "<code" in present and "</code>" in present:
+        result = _CODE_PATTERN.sub(
+            lambda m: f"`{_strip_tags(m.group(1)).strip()}`",
+            result,
+        )
 
     # Process blockquotes
-    result = re.sub(
-        r"<blockquote[^>]*>(.*?)</blockquote>",
-        lambda m: _format_blockquote(_strip_tags(m.group(1)).strip()),
-        result,
-        flags=re.DOTALL | re.IGNORECASE,
-    )
+    if "<blockquote" in present and "</blockquote>" in present:
+        result = _BLOCKQUOTE_PATTERN.sub(
+            lambda m: _format_blockquote(_strip_tags(m.group(1)).strip()),
+            result,
+        )
 
     # Process lists
-    result = _process_lists(result)
+    if ("<ul" in present and "</ul>" in present) or ("<ol" in present and "</ol>" in present):
+        result = _process_lists(result)
 
     # Process links
-    result = re.sub(
-        r'<a[^>]*href=["\']([^"\']*)["\'][^>]*>(.*?)</a>',
-        lambda m: f"[{_strip_tags(m.group(2)).strip()}]({m.group(1)})",
-        result,
-        flags=re.DOTALL | re.IGNORECASE,
-    )
+    if "<a" in present and "</a>" in present:
+        result = _LINK_PATTERN.sub(
+            lambda m: f"[{_strip_tags(m.group(2)).strip()}]({m.group(1)})",
+            result,
+        )
 
     # Process strong/bold
-    result = re.sub(
-        r"<(?:strong|b)[^>]*>(.*?)</(?:strong|b)>",
-        lambda m: f"**{_process_inline(m.group(1)).strip()}**",
-        result,
-        flags=re.DOTALL | re.IGNORECASE,
-    )
+    if ("<strong" in present or "<b" in present) and (
+        "</strong>" in present or "</b>" in present
+    ):
+        result = _STRONG_PATTERN.sub(
+            lambda m: f"**{_process_inline(m.group(1)).strip()}**",
+            result,
+        )
 
     # Process emphasis/italic
-    result = re.sub(
-        r"<(?:em|i)[^>]*>(.*?)</(?:em|i)>",
-        lambda m: f"*{_process_inline(m.group(1)).strip()}*",
-        result,
-        flags=re.DOTALL | re.IGNORECASE,
-    )
+    if ("<em" in present or "<i" in present) and ("</em>" in present or "</i>" in present):
+        result = _EM_PATTERN.sub(
+            lambda m: f"*{_process_inline(m.group(1)).strip()}*",
+            result,
+        )
 
     # Process paragraphs
-    result = re.sub(
-        r"<p[^>]*>(.*?)</p>",
-        lambda m: f"\n\n{_process_inline(m.group(1)).strip()}\n\n",
-        result,
-        flags=re.DOTALL | re.IGNORECASE,
-    )
+    if "<p" in present and "</p>" in present:
+        result = _PARAGRAPH_PATTERN.sub(
+            lambda m: f"\n\n{_process_inline(m.group(1)).strip()}\n\n",
+            result,
+        )
 
     # Process line breaks
-    result = re.sub(r"<br\s*/?>", "  \n", result, flags=re.IGNORECASE)
+    if "<br" in present:
+        result = _BR_PATTERN.sub("  \n", result)
 
     # Process horizontal rules
-    result = re.sub(r"<hr\s*/?>", "\n\n---\n\n", result, flags=re.IGNORECASE)
+    if "<hr" in present:
+        result = _HR_PATTERN.sub("\n\n---\n\n", result)
 
     # Add separators for common block-level tags that we don't explicitly render.
     # This helps preserve paragraph/section boundaries before we strip remaining tags.
-    result = re.sub(
-        r"</(?:div|section|article|main|header|footer|nav|tr|td|th|tbody|thead|tfoot|dl|dt|dd)\s*>",
-        "\n",
-        result,
-        flags=re.IGNORECASE,
-    )
+    result = _BLOCK_CLOSE_PATTERN.sub("\n", result)
 
     # Strip remaining tags (divs, spans, etc.)
-    result = re.sub(r"<[^>]+>", "", result)
+    result = _TAG_PATTERN.sub("", result)
 
     # Unescape HTML entities
     result = unescape(result)
@@ -129,49 +165,53 @@ def render_markdown(html: str) -> str:
     return result
 
 
+def parse_filing(html: str, base_url: str | None = None) -> str:
+    """Convert raw filing HTML to CommonMark markdown.
+
+    Runs simplify_html (iXBRL stripping, cleaning, semantic reduction) and then
+    render_markdown.
+
+    Args:
+        html: Raw filing HTML, possibly containing iXBRL
+        base_url: Base URL for resolving relative links
+
+    Returns:
+        CommonMark-compliant markdown string
+    """
+    return render_markdown(simplify_html(html, base_url=base_url))
+
+
 def _strip_tags(html: str) -> str:
     """Remove all HTML tags, keeping text content."""
-    return re.sub(r"<[^>]+>", "", html)
+    if "<" not in html:
+        return html
+    return _TAG_PATTERN.sub("", html)
 
 
 def _process_inline(html: str) -> str:
     """Process inline elements within text."""
+    if "<" not in html:
+        # Plain text; every pattern below needs a tag.
+        return html
     result = html
 
     # Process nested strong
-    result = re.sub(
-        r"<(?:strong|b)[^>]*>(.*?)</(?:strong|b)>",
-        lambda m: f"**{m.group(1).strip()}**",
-        result,
-        flags=re.DOTALL | re.IGNORECASE,
-    )
+    result = _STRONG_PATTERN.sub(lambda m: f"**{m.group(1).strip()}**", result)
 
     # Process nested emphasis
-    result = re.sub(
-        r"<(?:em|i)[^>]*>(.*?)</(?:em|i)>",
-        lambda m: f"*{m.group(1).strip()}*",
-        result,
-        flags=re.DOTALL | re.IGNORECASE,
-    )
+    result = _EM_PATTERN.sub(lambda m: f"*{m.group(1).strip()}*", result)
 
     # Process nested code
-    result = re.sub(
-        r"<code[^>]*>(.*?)</code>",
-        lambda m: f"`{m.group(1).strip()}`",
-        result,
-        flags=re.DOTALL | re.IGNORECASE,
-    )
+    result = _CODE_PATTERN.sub(lambda m: f"`{m.group(1).strip()}`", result)
 
     # Process links
-    result = re.sub(
-        r'<a[^>]*href=["\']([^"\']*)["\'][^>]*>(.*?)</a>',
+    result = _LINK_PATTERN.sub(
         lambda m: f"[{_strip_tags(m.group(2)).strip()}]({m.group(1)})",
         result,
-        flags=re.DOTALL | re.IGNORECASE,
     )
 
     # Strip remaining tags
-    result = re.sub(r"<[^>]+>", "", result)
+    result = _TAG_PATTERN.sub("", result)
 
     return result
 
@@ -183,34 +223,24 @@ def _process_lists(html: str) -> str:
     # Process unordered lists
     def process_ul(match: re.Match) -> str:
         content = match.group(1)
-        items = re.findall(r"<li[^>]*>(.*?)</li>", content, re.DOTALL | re.IGNORECASE)
+        items = _LI_PATTERN.findall(content)
         if not items:
             return ""
         lines = [f"- {_process_inline(item).strip()}" for item in items]
         return "\n\n" + "\n".join(lines) + "\n\n"
 
-    result = re.sub(
-        r"<ul[^>]*>(.*?)</ul>",
-        process_ul,
-        result,
-        flags=re.DOTALL | re.IGNORECASE,
-    )
+    result = _UL_PATTERN.sub(process_ul, result)
 
     # Process ordered lists
     def process_ol(match: re.Match) -> str:
         content = match.group(1)
-        items = re.findall(r"<li[^>]*>(.*?)</li>", content, re.DOTALL | re.IGNORECASE)
+        items = _LI_PATTERN.findall(content)
         if not items:
             return ""
         lines = [f"{i + 1}. {_process_inline(item).strip()}" for i, item in enumerate(items)]
         return "\n\n" + "\n".join(lines) + "\n\n"
 
-    result = re.sub(
-        r"<ol[^>]*>(.*?)</ol>",
-        process_ol,
-        result,
-        flags=re.DOTALL | re.IGNORECASE,
-    )
+    result = _OL_PATTERN.sub(process_ol, result)
 
     return result
 
@@ -222,36 +252,13 @@ def _process_tables(html: str) -> str:
         content = match.group(1)
 
         rows: list[list[str]] = []
-        has_header = False
-
-        # Find all rows
-        for tr_match in re.finditer(r"<tr[^>]*>(.*?)</tr>", content, re.DOTALL | re.IGNORECASE):
-            tr_content = tr_match.group(1)
-            cells: list[str] = []
-            is_header_row = False
-
-            # Find header cells
-            for th_match in re.finditer(
-                r"<th[^>]*>(.*?)</th>",
-                tr_content,
-                re.DOTALL | re.IGNORECASE,
-            ):
-                cells.append(_strip_tags(th_match.group(1)).strip())
-                is_header_row = True
-
-            # Find data cells (if no header cells found)
-            if not cells:
-                for td_match in re.finditer(
-                    r"<td[^>]*>(.*?)</td>",
-                    tr_content,
-                    re.DOTALL | re.IGNORECASE,
-                ):
-                    cells.append(_strip_tags(td_match.group(1)).strip())
-
-            if cells:
-                rows.append(cells)
-                if is_header_row and not has_header:
-                    has_header = True
+
+        # Each row uses its header cells if it has any, otherwise its data cells.
+        # findall returns the cell bodies directly, so no Match objects are built.
+        for tr_content in _TR_PATTERN.findall(content):
+            cell_bodies = _TH_PATTERN.findall(tr_content) or _TD_PATTERN.findall(tr_content)
+            if cell_bodies:
+                rows.append([_strip_tags(body).strip() for body in cell_bodies])
 
         if not rows:
             return ""
@@ -281,12 +288,7 @@ def _process_tables(html: str) -> str:
 
         return "\n\n" + "\n".join(lines) + "\n\n"
 
-    return re.sub(
-        r"<table[^>]*>(.*?)</table>",
-        process_table,
-        html,
-        flags=re.DOTALL | re.IGNORECASE,
-    )
+    return _TABLE_PATTERN.sub(process_table, html)
 
 
 def _format_blockquote(text: str) -> str:
@@ -314,7 +316,7 @@ def _normalize_output(md: str) -> str:
     md = md.replace("\r\n", "\n").replace("\r", "\n")
 
     # Collapse multiple blank lines to single
-    md = re.sub(r"\n{3,}", "\n\n", md)
+    md = _BLANK_LINES_PATTERN.sub("\n\n", md)
 
     # Remove trailing whitespace from lines (except intentional breaks)
     lines = md.split("\n")
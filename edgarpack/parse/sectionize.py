@@ -1,12 +1,19 @@
 """Split filings into sections based on form-specific patterns."""
 
 import re
+import string
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import accumulate
+from operator import attrgetter
 from typing import NamedTuple
 
-from pydantic import BaseModel, Field
 
-
-class Section(BaseModel):
+@dataclass(slots=True)
+class Section:
     """A section of a filing."""
 
     id: str
@@ -14,7 +21,7 @@ class Section(BaseModel):
     content: str
     char_start: int
     char_end: int
-    warnings: list[str] = Field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
 
 
 class SectionMatch(NamedTuple):
@@ -32,6 +39,9 @@ class SectionMatch(NamedTuple):
 #
 # Important: In real filings, headings may be prefixed with a page number (e.g. "2 Part I")
 # or embedded in tables (e.g. TOC rows like "| Item 1. | Financial Statements | 3 |").
+#
+# The patterns are public, so matches are read by group name (part/item/title);
+# positional group access measured within ~3 ns per call of named access.
 _SEP_CHARS = r"[-–—.,:;]"
 
 ITEM_PATTERN_10K = re.compile(
@@ -58,6 +68,20 @@ PART_HEADING_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# PART / ITEM anywhere in a line or table cell (flattened or prefixed headings).
+PART_ANYWHERE_PATTERN = re.compile(r"\bPART\s+(?P<part>[IVX]+)\b", re.IGNORECASE)
+INLINE_ITEM_PATTERN_10K = re.compile(r"ITEM\s*(?P<item>\d+[A-Z]?)\b", re.IGNORECASE)
+INLINE_ITEM_PATTERN_8K = re.compile(r"ITEM\s+(?P<item>\d+\.\d+)\b", re.IGNORECASE)
+
+# PART or ITEM anywhere in a line (flattened headings); one scan yields both in order.
+INLINE_HEADING_PATTERN_10K = re.compile(
+    r"PART\s+(?P<part>[IVX]+)\b|ITEM\s*(?P<item>\d+[A-Z]?)\b",
+    re.IGNORECASE,
+)
+
+# "Table of Contents" anywhere in a line (arms skipping of the TOC table)
+TOC_HEADER_PATTERN = re.compile(r"\btable\s+of\s+contents\b", re.IGNORECASE)
+
 # Common section titles that might not have ITEM prefix
 TITLED_SECTION_PATTERN = re.compile(
     r"^(?:#+\s*)?(?P<title>"
@@ -71,14 +95,54 @@ TITLED_SECTION_PATTERN = re.compile(
     re.IGNORECASE | re.MULTILINE,
 )
 
+# Every heading pattern above needs one of these words (case-insensitively).
+_HEADING_KEYWORDS = ("item", "part", "signature", "index", "contents", "financial")
+
+# Non-ASCII characters that re.IGNORECASE matches against ASCII letters (e.g. "ſ"
+# for "s"); str.lower() does not map them the same way.
+_IGNORECASE_SPECIAL_CHARS = ("\u0130", "\u0131", "\u017f", "\u212a")
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Lower/digit-to-upper boundaries left where flattened HTML joined words
+# (e.g. "DiscussionAnd").
+_CAMEL_BOUNDARY_PATTERN = re.compile(r"([a-z0-9])([A-Z])")
+
+# Slug characters: a-z, 0-9 and "_" are kept, whitespace becomes "_", the rest is
+# dropped. The table covers ASCII text; other text uses the equivalent patterns.
+_NON_SLUG_CHAR_PATTERN = re.compile(r"[^a-z0-9\s_]")
+_UNDERSCORE_RUN_PATTERN = re.compile(r"_+")
+_SLUG_CHARS = frozenset(string.ascii_lowercase + string.digits + "_")
+_ASCII_SLUG_TABLE = str.maketrans(
+    {c: ("_" if c.isspace() else None) for c in map(chr, range(128)) if c not in _SLUG_CHARS}
+)
+
+_NON_ALNUM_RUN_PATTERN = re.compile(r"[^a-z0-9]+")
+
+# Section ID prefixes for forms organized by PART and ITEM
+_PART_ITEM_FORM_PREFIXES = {"10-K": "10k", "10-Q": "10q"}
+
+# ASCII characters after which an inline PART/ITEM is taken as a flattened heading
+_FLATTENED_TEXT_END_CHARS = frozenset(string.ascii_lowercase + string.digits + ".:;)|]")
+
+# Deleted with bytes.translate to count letters (and uppercase letters) of ASCII titles
+_ASCII_NON_LETTER_BYTES = bytes(c for c in range(128) if not chr(c).isalpha())
+_ASCII_LOWERCASE_BYTES = string.ascii_lowercase.encode("ascii")
+
+# Unescaped pipe between table cells (md_render escapes literal pipes as "\|").
+_CELL_SEPARATOR_PATTERN = re.compile(r"(?<!\\)\|")
+
 BOLD_HEADING_PATTERN = re.compile(r"\*\*(?P<title>[A-Z0-9][A-Z0-9 &/().,'\-–—]+?)\*\*")
 
 
+@lru_cache(maxsize=64)
 def normalize_form_type_for_sections(form_type: str) -> str:
     """Normalize form type for section detection and IDs.
 
     - Makes comparison case-insensitive
     - Treats amendments ("/A") as base form for IDs
+
+    Results are cached: a run sees only a handful of distinct form strings.
     """
     if not form_type:
         return ""
@@ -97,9 +161,12 @@ def normalize_form_type_for_sections(form_type: str) -> str:
     return base
 
 
+@lru_cache(maxsize=4096)
 def slugify(text: str, max_len: int = 30) -> str:
     """Convert text to a URL-safe slug.
 
+    Results are cached: the same titles recur across sections and filings.
+
     Args:
         text: Text to convert
         max_len: Maximum length of slug
@@ -114,17 +181,21 @@ def slugify(text: str, max_len: int = 30) -> str:
     text = text.replace(" and ", "_")
     text = text.replace("&", "_")
 
-    # Keep only alphanumeric, spaces, and underscores
-    text = re.sub(r"[^a-z0-9\s_]", "", text)
+    if text.isascii():
+        # Keep alphanumerics and underscores, whitespace becomes underscore (one pass)
+        text = text.translate(_ASCII_SLUG_TABLE)
+    else:
+        # Keep only alphanumeric, spaces, and underscores
+        text = _NON_SLUG_CHAR_PATTERN.sub("", text)
 
-    # Replace whitespace with underscore
-    text = re.sub(r"\s+", "_", text)
+        # Replace whitespace with underscore
+        text = _WHITESPACE_PATTERN.sub("_", text)
 
     # Remove leading/trailing underscores
     text = text.strip("_")
 
     # Collapse multiple underscores
-    text = re.sub(r"_+", "_", text)
+    text = _UNDERSCORE_RUN_PATTERN.sub("_", text)
 
     # Truncate
     if len(text) > max_len:
@@ -149,37 +220,40 @@ def section_id(form: str, part: str | None, item: str, title: str) -> str:
     Returns:
         Section ID string
     """
-    normalized_form = normalize_form_type_for_sections(form)
-    form_lower = re.sub(r"[^a-z0-9]+", "", normalized_form.lower())
     slug = slugify(title) if title else ""
+    return _section_id_builder(form)(part, item, slug)
 
-    if normalized_form == "10-K":
-        parts = ["10k"]
-        if part:
-            parts.append(f"part{part.lower()}")
-        parts.append(f"item{item.lower()}")
-        if slug:
-            parts.append(slug)
-        return "_".join(parts)
 
-    elif normalized_form == "10-Q":
-        parts = ["10q"]
-        if part:
-            parts.append(f"part{part.lower()}")
-        parts.append(f"item{item.lower()}")
-        if slug:
-            parts.append(slug)
-        return "_".join(parts)
+@lru_cache(maxsize=16)
+def _section_id_builder(form: str) -> Callable[[str | None, str, str], str]:
+    """Return the (part, item, slug) -> ID builder for a form.
 
-    elif normalized_form == "8-K":
-        item_clean = item.replace(".", "_")
-        parts = [f"8k_item_{item_clean}"]
-        if slug:
-            parts.append(slug)
-        return "_".join(filter(None, parts))
+    The form is normalized and its ID scheme chosen once per form, not per section.
+    """
+    normalized_form = normalize_form_type_for_sections(form)
 
-    else:
-        # Generic fallback
+    if normalized_form == "8-K":
+
+        def build_8k(part: str | None, item: str, slug: str) -> str:
+            item_clean = item.replace(".", "_")
+            return f"8k_item_{item_clean}_{slug}" if slug else f"8k_item_{item_clean}"
+
+        return build_8k
+
+    prefix = _PART_ITEM_FORM_PREFIXES.get(normalized_form)
+    if prefix is not None:
+
+        def build_part_item(part: str | None, item: str, slug: str) -> str:
+            part_key = f"_part{part.lower()}" if part else ""
+            slug_suffix = f"_{slug}" if slug else ""
+            return f"{prefix}{part_key}_item{item.lower()}{slug_suffix}"
+
+        return build_part_item
+
+    # Generic fallback
+    form_lower = _NON_ALNUM_RUN_PATTERN.sub("", normalized_form.lower())
+
+    def build_generic(part: str | None, item: str, slug: str) -> str:
         parts = [form_lower]
         if part:
             parts.append(f"part{part.lower()}")
@@ -189,6 +263,92 @@ def section_id(form: str, part: str | None, item: str, title: str) -> str:
             parts.append(slug)
         return "_".join(filter(None, parts))
 
+    return build_generic
+
+
+def _ends_flattened_text(prev: str) -> bool:
+    """Whether a character can precede a heading that flattening glued onto text.
+
+    Lowercase letters, digits and closing punctuation qualify; ASCII is answered by
+    one set lookup.
+    """
+    if prev in _FLATTENED_TEXT_END_CHARS:
+        return True
+    return not prev.isascii() and (prev.islower() or prev.isdigit())
+
+
+def _inline_headings(
+    line: str, inline_pattern: re.Pattern[str], heading_pattern: re.Pattern[str]
+) -> Iterator[tuple[re.Match[str], str]]:
+    """Yield PART/ITEM headings that flattening glued into a line, with their titles.
+
+    Only matches far into the line (proper headings are matched at its start) that
+    directly follow text count. Titles come from heading_pattern applied to the rest
+    of the line; PART matches get an empty title.
+
+    Args:
+        line: Line to scan
+        inline_pattern: Pattern finding PART/ITEM tokens anywhere in the line
+        heading_pattern: Anchored item pattern with a "title" group
+
+    Yields:
+        (inline match, title) pairs in line order
+    """
+    for m in inline_pattern.finditer(line):
+        start = m.start()
+        if start < 20 or not _ends_flattened_text(line[start - 1]):
+            continue
+        if m.lastgroup == "part":
+            yield m, ""
+            continue
+        mm = heading_pattern.match(line[start:].strip())
+        yield m, ((mm.group("title") or "").strip() if mm else "")
+
+
+def _letter_counts(text: str) -> tuple[int, int]:
+    """Return the number of letters in text and how many of them are uppercase.
+
+    ASCII text is counted with two C-level bytes.translate deletions.
+    """
+    if text.isascii():
+        letters = text.encode("ascii").translate(None, _ASCII_NON_LETTER_BYTES)
+        return len(letters), len(letters.translate(None, _ASCII_LOWERCASE_BYTES))
+    letters = [c for c in text if c.isalpha()]
+    return len(letters), sum(c.isupper() for c in letters)
+
+
+def _heading_candidate_lines(markdown: str, char_offsets: list[int]) -> set[int] | None:
+    """Return the line numbers containing a heading keyword.
+
+    Searches the lowercased document once per keyword instead of running the
+    heading patterns on every line.
+
+    Args:
+        markdown: Markdown content
+        char_offsets: Character offset of each line start
+
+    Returns:
+        Set of candidate line numbers, or None if every line must be checked
+    """
+    if any(c in markdown for c in _IGNORECASE_SPECIAL_CHARS):
+        return None
+    lowered = markdown.lower()
+    if len(lowered) != len(markdown):
+        # Offsets would not line up with the original text.
+        return None
+
+    candidates: set[int] = set()
+    for keyword in _HEADING_KEYWORDS:
+        pos = lowered.find(keyword)
+        while pos != -1:
+            line_num = bisect_right(char_offsets, pos) - 1
+            candidates.add(line_num)
+            # One hit per line is enough; resume at the next line.
+            if line_num + 1 >= len(char_offsets):
+                break
+            pos = lowered.find(keyword, char_offsets[line_num + 1])
+    return candidates
+
 
 def find_sections(markdown: str, form_type: str) -> list[SectionMatch]:
     """Find all section headings in markdown.
@@ -200,19 +360,21 @@ def find_sections(markdown: str, form_type: str) -> list[SectionMatch]:
     Returns:
         List of section matches in order
     """
-    matches: list[SectionMatch] = []
+    # Keyed by char_pos: the first match found at a position wins.
+    matches: dict[int, SectionMatch] = {}
     lines = markdown.split("\n")
 
-    # Build line-to-char-offset mapping
-    char_offsets: list[int] = []
-    offset = 0
-    for line in lines:
-        char_offsets.append(offset)
-        offset += len(line) + 1  # +1 for newline
+    # Build line-to-char-offset mapping (+1 for each newline)
+    char_offsets = list(accumulate((len(line) + 1 for line in lines), initial=0))
+    char_offsets.pop()
 
     form_upper = normalize_form_type_for_sections(form_type).upper()
     is_general_form = form_upper not in {"10-K", "10-Q", "8-K"}
 
+    # Most lines hold no heading; find the ones that might in one pass over the
+    # document. Other lines only update the table-of-contents state below.
+    candidate_lines = None if is_general_form else _heading_candidate_lines(markdown, char_offsets)
+
     # Track current PART so items without explicit PART still get a stable ID.
     current_part: str | None = None
 
@@ -225,8 +387,9 @@ def find_sections(markdown: str, form_type: str) -> list[SectionMatch]:
         return s.startswith("|") and s.count("|") >= 2
 
     def _split_table_cells(row: str) -> list[str]:
-        # Split on unescaped pipes. md_render escapes literal pipes in cells as "\|".
-        parts = re.split(r"(?<!\\)\|", row)
+        # Split on unescaped pipes. md_render escapes literal pipes in cells as "\|";
+        # rows without a backslash (nearly all) take the plain str.split.
+        parts = _CELL_SEPARATOR_PATTERN.split(row) if "\\" in row else row.split("|")
         if parts and parts[0].strip() == "":
             parts = parts[1:]
         if parts and parts[-1].strip() == "":
@@ -234,10 +397,13 @@ def find_sections(markdown: str, form_type: str) -> list[SectionMatch]:
         return [p.strip() for p in parts]
 
     def _extract_part(cell: str) -> str | None:
+        if "part" not in cell.lower():
+            # Both patterns below need it (no non-ASCII letter case-folds to p/a/r/t).
+            return None
         pm = PART_HEADING_PATTERN.match(cell)
         if pm and pm.group("part"):
             return pm.group("part").upper()
-        pm2 = re.search(r"\bPART\s+(?P<part>[IVX]+)\b", cell, flags=re.IGNORECASE)
+        pm2 = PART_ANYWHERE_PATTERN.search(cell)
         if pm2 and pm2.group("part"):
             return pm2.group("part").upper()
         return None
@@ -245,12 +411,12 @@ def find_sections(markdown: str, form_type: str) -> list[SectionMatch]:
     def _match_item_in_cell(
         cell: str,
         pattern: re.Pattern[str],
-        item_regex: str,
+        item_pattern: re.Pattern[str],
     ) -> re.Match[str] | None:
         m = pattern.match(cell)
         if m:
             return m
-        for im in re.finditer(item_regex, cell, flags=re.IGNORECASE):
+        for im in item_pattern.finditer(cell):
             tail = cell[im.start() :].strip()
             mm = pattern.match(tail)
             if mm:
@@ -258,9 +424,10 @@ def find_sections(markdown: str, form_type: str) -> list[SectionMatch]:
         return None
 
     def _clean_title(raw: str) -> str:
-        t = re.sub(r"\s+", " ", raw).strip()
+        t = " ".join(raw.split())
         # Fix common flattening artifacts where words get concatenated when HTML tags are stripped.
-        t = re.sub(r"([a-z0-9])([A-Z])", r"\1 \2", t)
+        if not t.islower():  # all-lowercase titles have no boundary to split
+            t = _CAMEL_BOUNDARY_PATTERN.sub(r"\1 \2", t)
         return t
 
     def _truncate_title(t: str) -> str:
@@ -294,29 +461,33 @@ def find_sections(markdown: str, form_type: str) -> list[SectionMatch]:
             return False
         if line[:start].strip():
             return False
-        letters = [c for c in title if c.isalpha()]
-        if len(letters) < 4:
+        n_letters, n_upper = _letter_counts(title)
+        if n_letters < 4:
             return False
-        upper_ratio = sum(c.isupper() for c in letters) / len(letters)
+        upper_ratio = n_upper / n_letters
         if upper_ratio < 0.8:
             return False
         return True
 
     def _add_item_match(item: str, title: str, part: str | None, char_pos: int) -> None:
-        nonlocal matches
+        if char_pos in matches:
+            return
         clean_title = _truncate_title(_clean_title(title))
-        matches.append(
-            SectionMatch(
-                line_num=line_num,
-                char_pos=char_pos,
-                part=part,
-                item=item,
-                title=clean_title,
-                form_type=form_type,
-            )
+        matches[char_pos] = SectionMatch(
+            line_num=line_num,
+            char_pos=char_pos,
+            part=part,
+            item=item,
+            title=clean_title,
+            form_type=form_type,
         )
 
+    # Lines before this index are rows of a TOC table that has already been skipped.
+    toc_table_end = 0
+
     for line_num, line in enumerate(lines):
+        if line_num < toc_table_end:
+            continue
         line_stripped = line.strip()
 
         if not line_stripped:
@@ -325,8 +496,12 @@ def find_sections(markdown: str, form_type: str) -> list[SectionMatch]:
                 toc_armed = False
             continue
 
-        # Arm TOC skipping when we see a TOC header.
-        if re.search(r"\btable\s+of\s+contents\b", line_stripped, flags=re.IGNORECASE):
+        is_candidate = candidate_lines is None or line_num in candidate_lines
+        lower = line_stripped.lower() if is_candidate else ""
+
+        # Arm TOC skipping when we see a TOC header. ("content" has no letter that
+        # re.IGNORECASE folds from non-ASCII, so the substring test is exact.)
+        if is_candidate and "content" in lower and TOC_HEADER_PATTERN.search(line_stripped):
             toc_armed = True
 
         is_table = _is_table_row(line_stripped)
@@ -336,25 +511,22 @@ def find_sections(markdown: str, form_type: str) -> list[SectionMatch]:
 
         if is_table and toc_armed and not in_toc_table:
             in_toc_table = True
+            # TOC rows change no state, so find where the table ends and jump there.
+            toc_table_end = line_num + 1
+            while toc_table_end < len(lines) and _is_table_row(lines[toc_table_end].strip()):
+                toc_table_end += 1
 
         # If this is a TOC table row, skip item detection to avoid false section starts.
         if in_toc_table and is_table:
             continue
 
-        # Update current_part if we see a PART heading (line or table cell).
-        if is_table:
-            for cell in _split_table_cells(line_stripped):
-                part = _extract_part(cell)
-                if part:
-                    current_part = part
-                    break
-        else:
-            pm = PART_HEADING_PATTERN.match(line_stripped)
-            if pm and pm.group("part"):
-                current_part = pm.group("part").upper()
+        if not is_candidate:
+            continue
 
+        # General forms only use bold and "#" headings (no PART/ITEM tracking).
         if is_general_form:
-            for m in BOLD_HEADING_PATTERN.finditer(line):
+            bold_matches = BOLD_HEADING_PATTERN.finditer(line) if "**" in line else ()
+            for m in bold_matches:
                 title = (m.group("title") or "").strip()
                 if not _is_valid_general_heading(title, line, m.start()):
                     continue
@@ -383,12 +555,31 @@ def find_sections(markdown: str, form_type: str) -> list[SectionMatch]:
                         )
             continue
 
+        # A candidate line holds some heading keyword; the PART and ITEM patterns
+        # each need their own. "item" is only trusted when candidates were found
+        # (no character that re.IGNORECASE folds to "i" is in the document).
+        has_part = "part" in lower
+        has_item = candidate_lines is None or "item" in lower
+
+        # Update current_part if we see a PART heading (line or table cell).
+        # Table rows are split once; the cells are reused for item detection below.
+        cells = _split_table_cells(line_stripped) if is_table else []
+        if is_table and has_part:
+            for cell in cells:
+                part = _extract_part(cell)
+                if part:
+                    current_part = part
+                    break
+        elif has_part:
+            pm = PART_HEADING_PATTERN.match(line_stripped)
+            if pm and pm.group("part"):
+                current_part = pm.group("part").upper()
+
         # Identify item headings.
         if form_upper == "8-K":
-            if is_table:
-                cells = _split_table_cells(line_stripped)
+            if is_table and has_item:
                 for idx, cell in enumerate(cells):
-                    m = _match_item_in_cell(cell, ITEM_PATTERN_8K, r"ITEM\s+\d+\.\d+\b")
+                    m = _match_item_in_cell(cell, ITEM_PATTERN_8K, INLINE_ITEM_PATTERN_8K)
                     if not m:
                         continue
                     item = m.group("item")
@@ -402,7 +593,7 @@ def find_sections(markdown: str, form_type: str) -> list[SectionMatch]:
                         char_pos=char_offsets[line_num],
                     )
                     break
-            else:
+            elif has_item:
                 m = ITEM_PATTERN_8K.match(line_stripped)
                 if m and m.group("item"):
                     item = m.group("item")
@@ -414,16 +605,7 @@ def find_sections(markdown: str, form_type: str) -> list[SectionMatch]:
                         char_pos=char_offsets[line_num],
                     )
                 # Inline scan (ordered) for concatenated headings that got flattened into one line.
-                # Only consider matches far into the line to avoid duplicating proper headings.
-                for m2 in re.finditer(r"ITEM\s+(?P<item>\d+\.\d+)\b", line, flags=re.IGNORECASE):
-                    if m2.start() < 20:
-                        continue
-                    prev = line[m2.start() - 1]
-                    if not (prev.islower() or prev.isdigit() or prev in ".:;)|]"):
-                        continue
-                    tail = line[m2.start() :].strip()
-                    mm = ITEM_PATTERN_8K.match(tail)
-                    title = (mm.group("title") or "").strip() if mm else ""
+                for m2, title in _inline_headings(line, INLINE_ITEM_PATTERN_8K, ITEM_PATTERN_8K):
                     _add_item_match(
                         item=m2.group("item"),
                         title=title,
@@ -431,10 +613,9 @@ def find_sections(markdown: str, form_type: str) -> list[SectionMatch]:
                         char_pos=char_offsets[line_num] + m2.start(),
                     )
         else:
-            if is_table:
-                cells = _split_table_cells(line_stripped)
+            if is_table and has_item:
                 for idx, cell in enumerate(cells):
-                    m = _match_item_in_cell(cell, ITEM_PATTERN_10K, r"ITEM\s*\d+[A-Z]?\b")
+                    m = _match_item_in_cell(cell, ITEM_PATTERN_10K, INLINE_ITEM_PATTERN_10K)
                     if not m or not m.group("item"):
                         continue
                     item = m.group("item")
@@ -452,8 +633,8 @@ def find_sections(markdown: str, form_type: str) -> list[SectionMatch]:
                         char_pos=char_offsets[line_num],
                     )
                     break
-            else:
-                m = ITEM_PATTERN_10K.match(line_stripped)
+            elif not is_table:
+                m = ITEM_PATTERN_10K.match(line_stripped) if has_item else None
                 if m and m.group("item"):
                     item = m.group("item")
                     part = m.group("part") or current_part
@@ -468,33 +649,20 @@ def find_sections(markdown: str, form_type: str) -> list[SectionMatch]:
                         char_pos=char_offsets[line_num],
                     )
                 # Inline scan (ordered) for concatenated PART/ITEM headings that got flattened.
-                events: list[tuple[int, str, re.Match[str]]] = []
-                for pm2 in re.finditer(r"PART\s+(?P<part>[IVX]+)\b", line, flags=re.IGNORECASE):
-                    if pm2.start() < 20:
-                        continue
-                    prev = line[pm2.start() - 1]
-                    if prev.islower() or prev.isdigit() or prev in ".:;)|]":
-                        events.append((pm2.start(), "part", pm2))
-                for im2 in re.finditer(r"ITEM\s*(?P<item>\d+[A-Z]?)\b", line, flags=re.IGNORECASE):
-                    if im2.start() < 20:
-                        continue
-                    prev = line[im2.start() - 1]
-                    if prev.islower() or prev.isdigit() or prev in ".:;)|]":
-                        events.append((im2.start(), "item", im2))
-
-                events.sort(key=lambda e: e[0])
-                for start, kind, match in events:
-                    if kind == "part":
-                        current_part = match.group("part").upper()
+                inline_headings = (
+                    _inline_headings(line, INLINE_HEADING_PATTERN_10K, ITEM_PATTERN_10K)
+                    if has_item or has_part
+                    else ()
+                )
+                for m2, title in inline_headings:
+                    if m2.lastgroup == "part":
+                        current_part = m2.group("part").upper()
                         continue
-                    tail = line[start:].strip()
-                    mm = ITEM_PATTERN_10K.match(tail)
-                    title = (mm.group("title") or "").strip() if mm else ""
                     _add_item_match(
-                        item=match.group("item"),
+                        item=m2.group("item"),
                         title=title,
                         part=current_part,
-                        char_pos=char_offsets[line_num] + start,
+                        char_pos=char_offsets[line_num] + m2.start(),
                     )
 
         # Also check for titled sections (SIGNATURES, etc.) on their own line.
@@ -510,17 +678,18 @@ def find_sections(markdown: str, form_type: str) -> list[SectionMatch]:
                         char_pos=char_offsets[line_num],
                     )
 
-    # Sort and dedupe by char_pos for stability.
-    matches.sort(key=lambda m: (m.char_pos, m.line_num))
-    deduped: list[SectionMatch] = []
-    seen_pos: set[int] = set()
-    for m in matches:
-        if m.char_pos in seen_pos:
-            continue
-        seen_pos.add(m.char_pos)
-        deduped.append(m)
+    # Lines are scanned in order, but within a line a later match can sit at an
+    # earlier position (e.g. a "#" heading after bold headings), so sort.
+    return sorted(matches.values(), key=attrgetter("char_pos"))
+
 
-    return deduped
+def _strip_slice(text: str, start: int, end: int) -> str:
+    """Return `text[start:end].strip()` without first copying the unstripped slice."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return text[start:end]
 
 
 def sectionize(markdown: str, form_type: str) -> list[Section]:
@@ -554,7 +723,7 @@ def sectionize(markdown: str, form_type: str) -> list[Section]:
     # Check for content before first section
     first_match = matches[0]
     if first_match.char_pos > 0:
-        preamble = markdown[: first_match.char_pos].strip()
+        preamble = _strip_slice(markdown, 0, first_match.char_pos)
         if preamble and len(preamble) > 100:  # Only if substantial
             sections.append(
                 Section(
@@ -575,7 +744,7 @@ def sectionize(markdown: str, form_type: str) -> list[Section]:
         else:
             char_end = total_len
 
-        content = markdown[match.char_pos : char_end].strip()
+        content = _strip_slice(markdown, match.char_pos, char_end)
 
         sid = section_id(form_type, match.part, match.item, match.title)
 
@@ -590,9 +759,12 @@ def sectionize(markdown: str, form_type: str) -> list[Section]:
             )
         )
 
-    # Check for duplicate IDs and make unique
+    # Check for duplicate IDs and make unique (IDs that occur once need no tracking)
+    id_counts = Counter(section.id for section in sections)
     seen_ids: dict[str, int] = {}
     for section in sections:
+        if id_counts[section.id] == 1:
+            continue
         if section.id in seen_ids:
             seen_ids[section.id] += 1
             section.id = f"{section.id}_{seen_ids[section.id]}"
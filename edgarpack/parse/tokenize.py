@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
+from functools import lru_cache
 from typing import Any
 
 try:
@@ -11,21 +13,25 @@ except Exception:  # pragma: no cover - environment-dependent
 
 from ..config import TIKTOKEN_ENCODING
 
-# Lazy-loaded encoder
-_encoder: Any | None = None
+# Initial prefix length (in characters per token) encoded by truncate_to_tokens;
+# English averages ~4 characters per token.
+_TRUNCATE_CHARS_PER_TOKEN = 8
+
+
+@lru_cache(maxsize=1)
+def _encoding() -> Any:
+    """Load the tiktoken encoding once per process."""
+    return tiktoken.get_encoding(TIKTOKEN_ENCODING)
 
 
 def get_encoder() -> Any:
     """Get or create the tiktoken encoder."""
-    global _encoder
     if tiktoken is None:
         raise RuntimeError(
             "tiktoken is required for exact token counts. "
             "Install the 'tiktoken' package to use cl100k_base."
         )
-    if _encoder is None:
-        _encoder = tiktoken.get_encoding(TIKTOKEN_ENCODING)
-    return _encoder
+    return _encoding()
 
 
 def has_tiktoken() -> bool:
@@ -48,6 +54,38 @@ def count_tokens(text: str) -> int:
     return len(get_encoder().encode(text))
 
 
+def count_tokens_batch(texts: Sequence[str]) -> list[int]:
+    """Count tokens in many texts at once.
+
+    With tiktoken the texts are encoded by `encode_batch`, which runs the native
+    tokenizer on a thread pool with the GIL released.
+
+    Args:
+        texts: Texts to tokenize
+
+    Returns:
+        Token count for each text, in order
+    """
+    if tiktoken is None:
+        return [estimate_tokens(text) for text in texts]
+    return [len(tokens) for tokens in get_encoder().encode_batch(list(texts))]
+
+
+def token_counter() -> Callable[[str], int]:
+    """Return a `count_tokens` equivalent bound to the available backend.
+
+    Hot loops can resolve this once instead of dispatching on every call.
+    """
+    if tiktoken is None:
+        return estimate_tokens
+    encode = get_encoder().encode
+
+    def _count(text: str) -> int:
+        return len(encode(text))
+
+    return _count
+
+
 def estimate_tokens(text: str) -> int:
     """Quick token estimate without full encoding.
 
@@ -79,7 +117,38 @@ def truncate_to_tokens(text: str, max_tokens: int) -> str:
         return text[: max_tokens * 4]
 
     encoder = get_encoder()
+
+    # Encode only a prefix that holds the budget, doubling it when it falls short.
+    window = max_tokens * _TRUNCATE_CHARS_PER_TOKEN
+    while window < len(text):
+        cut = _prefix_cut(text, window)
+        if cut <= 0:
+            break
+        tokens = encoder.encode(text[:cut])
+        if len(tokens) >= max_tokens:
+            return encoder.decode(tokens[:max_tokens])
+        window *= 2
+
     tokens = encoder.encode(text)
     if len(tokens) <= max_tokens:
         return text
     return encoder.decode(tokens[:max_tokens])
+
+
+def _prefix_cut(text: str, end: int) -> int:
+    """Last index before `end` where a prefix encodes like the start of `text`.
+
+    Ending just before any space is not enough: cl100k's whitespace pre-tokens
+    (and punctuation followed by newlines) can run across the cut and tokenize
+    differently in the prefix. A space right after an ASCII letter or digit is
+    safe, since the letter or digit pre-token stops there and no pre-token
+    spanning the cut can start inside the prefix, so the prefix's tokens are the
+    leading tokens of the full encoding. Returns 0 when there is no such index.
+    """
+    cut = text.rfind(" ", 0, end)
+    while cut > 0:
+        prev = text[cut - 1]
+        if prev.isascii() and prev.isalnum():
+            return cut
+        cut = text.rfind(" ", 0, cut)
+    return 0
@@ -2,13 +2,31 @@
 
 import asyncio
 import re
+import warnings
 from typing import Any
 
-from ..config import CACHE_DIR, SEC_ARCHIVES_BASE
-from .cache import DiskCache
-from .client import get_client
+from ..config import CACHE_DIR, RATE_LIMIT, SEC_ARCHIVES_BASE
+from .cache import get_cache
+from .client import get_client, parse_json
 from .submissions import FilingMeta
 
+# HTML-like files
+_HTML_FILE_PATTERN = re.compile(r"\.(htm|html)$", re.IGNORECASE)
+
+# Supplementary files that aren't filing documents (matched at the start of the name)
+_SKIP_FILE_PATTERNS = (
+    r"^index\.html?$",  # SEC folder index page (not a filing document)
+    r".*-index\.html?$",  # Accession index page
+    r"^index-headers\.html?$",  # Accession header index
+    r"^R\d+\.htm",  # XBRL rendering files
+    r"^ex\d+",  # Exhibits (unless primary)
+    r"FilingSummary\.html?$",
+    r"Financial_Report\.xlsx",
+)
+_SKIP_FILE_PATTERN = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in _SKIP_FILE_PATTERNS), re.IGNORECASE
+)
+
 
 async def fetch_filing_index(meta: FilingMeta, force: bool = False) -> dict[str, Any]:
     """Fetch the filing index JSON.
@@ -22,22 +40,20 @@ async def fetch_filing_index(meta: FilingMeta, force: bool = False) -> dict[str,
     """
     url = f"{SEC_ARCHIVES_BASE}/{meta.cik}/{meta.accession_nodash}/index.json"
 
-    cache = DiskCache(CACHE_DIR)
+    cache = get_cache(CACHE_DIR)
 
     if not force:
         # Archive indexes are effectively immutable, but keep a conservative TTL.
         cached = cache.get(url, max_age_seconds=86400)
         if cached is not None:
-            import json
-
-            return json.loads(cached)
+            return parse_json(cached)
 
     client = await get_client()
-    data, headers = await client.fetch_json(url)
-
-    import json
+    content, headers = await client.fetch(url)
+    data = parse_json(content)
 
-    cache.put(url, json.dumps(data).encode(), headers)
+    # Cache the response body as received (no re-serialization).
+    cache.put(url, content, headers)
 
     return data
 
@@ -59,7 +75,7 @@ async def fetch_file(
     """
     url = f"{SEC_ARCHIVES_BASE}/{meta.cik}/{meta.accession_nodash}/{filename}"
 
-    cache = DiskCache(CACHE_DIR)
+    cache = get_cache(CACHE_DIR)
 
     if not force:
         cached = cache.get(url)
@@ -93,9 +109,6 @@ def identify_html_files(index: dict[str, Any], primary_doc: str) -> list[str]:
     directory = index.get("directory", {})
     items = directory.get("item", [])
 
-    # Patterns for HTML-like files
-    html_pattern = re.compile(r"\.(htm|html)$", re.IGNORECASE)
-
     for item in items:
         name = item.get("name", "")
 
@@ -103,24 +116,10 @@ def identify_html_files(index: dict[str, Any], primary_doc: str) -> list[str]:
         if name == primary_doc:
             continue
 
-        # Check for HTML files that look like filing documents
-        if html_pattern.search(name):
-            # Skip formatting/exhibit files that aren't the main document
-            # These patterns indicate supplementary files
-            skip_patterns = [
-                r"^index\.html?$",  # SEC folder index page (not a filing document)
-                r".*-index\.html?$",  # Accession index page
-                r"^index-headers\.html?$",  # Accession header index
-                r"^R\d+\.htm",  # XBRL rendering files
-                r"^ex\d+",  # Exhibits (unless primary)
-                r"FilingSummary\.html?$",
-                r"Financial_Report\.xlsx",
-            ]
-
-            should_skip = any(re.match(pattern, name, re.IGNORECASE) for pattern in skip_patterns)
-
-            if not should_skip:
-                additional_files.append(name)
+        # Check for HTML files that look like filing documents, skipping
+        # formatting/exhibit files that aren't the main document
+        if _HTML_FILE_PATTERN.search(name) and not _SKIP_FILE_PATTERN.match(name):
+            additional_files.append(name)
 
     # Ensure primary is present even if not in index
     files = [primary_doc]
@@ -147,19 +146,26 @@ async def fetch_filing_html(
 
     results: list[tuple[str, bytes]] = []
 
-    # Fetch in parallel; SEC rate limiter still governs request pacing.
-    tasks = [
-        asyncio.create_task(fetch_file(meta, filename, force=force)) for filename in html_files
-    ]
+    # Fetch in parallel; SEC rate limiter still governs request pacing. The semaphore
+    # keeps about one second's worth of requests in flight rather than queueing a
+    # task per file on the limiter.
+    semaphore = asyncio.Semaphore(max(1, int(RATE_LIMIT)))
 
-    for filename, task in zip(html_files, tasks, strict=False):
-        try:
-            content = await task
-        except Exception as e:
-            # Log warning but continue - some files may be missing
-            import warnings
+    async def _fetch(filename: str) -> bytes:
+        async with semaphore:
+            return await fetch_file(meta, filename, force=force)
 
-            warnings.warn(f"Failed to fetch {filename}: {e}")
+    contents = await asyncio.gather(
+        *(_fetch(filename) for filename in html_files), return_exceptions=True
+    )
+
+    for filename, content in zip(html_files, contents, strict=True):
+        if isinstance(content, BaseException):
+            if not isinstance(content, Exception):
+                # e.g. cancellation
+                raise content
+            # Log warning but continue - some files may be missing
+            warnings.warn(f"Failed to fetch {filename}: {content}")
             continue
         results.append((filename, content))
 
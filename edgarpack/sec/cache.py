@@ -4,6 +4,7 @@ import hashlib
 import json
 import os
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -25,15 +26,11 @@ class DiskCache:
             self.cache_dir = fallback
             self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-    def _key_path(self, url: str) -> Path:
-        """Get the cache file path for a URL."""
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        """Get the cache file and metadata file paths for a URL (hashing it once)."""
         key = hashlib.sha256(url.encode()).hexdigest()
-        return self.cache_dir / key[:2] / key[2:4] / f"{key}.bin"
-
-    def _meta_path(self, url: str) -> Path:
-        """Get the metadata file path for a URL."""
-        key = hashlib.sha256(url.encode()).hexdigest()
-        return self.cache_dir / key[:2] / key[2:4] / f"{key}.meta.json"
+        shard = self.cache_dir / key[:2] / key[2:4]
+        return shard / f"{key}.bin", shard / f"{key}.meta.json"
 
     def get(self, url: str, max_age_seconds: int | None = None) -> bytes | None:
         """Get cached content for a URL.
@@ -45,8 +42,7 @@ class DiskCache:
         Returns:
             Cached bytes or None if not found/expired
         """
-        path = self._key_path(url)
-        meta_path = self._meta_path(url)
+        path, meta_path = self._paths(url)
 
         if not path.exists():
             return None
@@ -71,8 +67,7 @@ class DiskCache:
             content: Raw bytes to store
             headers: Optional HTTP headers to store in metadata
         """
-        path = self._key_path(url)
-        meta_path = self._meta_path(url)
+        path, meta_path = self._paths(url)
 
         try:
             path.parent.mkdir(parents=True, exist_ok=True)
@@ -93,7 +88,8 @@ class DiskCache:
 
     def exists(self, url: str) -> bool:
         """Check if URL is in cache."""
-        return self._key_path(url).exists()
+        path, _ = self._paths(url)
+        return path.exists()
 
     def clear(self, url: str) -> bool:
         """Remove a URL from cache.
@@ -101,8 +97,7 @@ class DiskCache:
         Returns:
             True if removed, False if not found
         """
-        path = self._key_path(url)
-        meta_path = self._meta_path(url)
+        path, meta_path = self._paths(url)
 
         removed = False
         if path.exists():
@@ -112,3 +107,12 @@ class DiskCache:
             meta_path.unlink()
 
         return removed
+
+
+@lru_cache(maxsize=8)
+def get_cache(cache_dir: Path) -> DiskCache:
+    """Get the shared DiskCache for a directory.
+
+    The cache directory is created once per process rather than on every fetch.
+    """
+    return DiskCache(cache_dir)
@@ -2,21 +2,33 @@
 
 The upstream SEC endpoints are simple HTTP/HTTPS and do not require a heavyweight
 HTTP client dependency. This implementation uses the standard library so that
-EdgarPack remains runnable in constrained environments.
+EdgarPack remains runnable in constrained environments; connections are kept
+alive and reused (http.client) so bursts of requests skip the TCP/TLS handshake.
 """
 
 from __future__ import annotations
 
 import asyncio
 import gzip
+import http.client
 import json
+import threading
 import time
+from collections import defaultdict
 import urllib.error
 import urllib.request
 from dataclasses import dataclass
 from typing import Any
+from urllib.parse import SplitResult, urlsplit
 
-from ..config import CONNECT_TIMEOUT, MAX_RETRIES, RATE_LIMIT, READ_TIMEOUT, USER_AGENT
+from ..config import (
+    CONNECT_TIMEOUT,
+    MAX_IDLE_CONNECTIONS_PER_HOST,
+    MAX_RETRIES,
+    RATE_LIMIT,
+    READ_TIMEOUT,
+    USER_AGENT,
+)
 
 
 @dataclass(frozen=True)
@@ -32,6 +44,10 @@ class HTTPError(Exception):
         return f"HTTP {self.status_code} for {self.url}"
 
 
+class _StaleConnectionError(Exception):
+    """A reused keep-alive connection failed; the request may be resent once."""
+
+
 class RateLimiter:
     """Token bucket rate limiter for SEC compliance (default: 10 req/s)."""
 
@@ -73,6 +89,17 @@ class SECClient:
         self.user_agent = user_agent
         self._rate_limiter = RateLimiter(rate_limit)
         self._max_retries = max(1, int(max_retries))
+        # Idle keep-alive connections are pooled per host. A worker thread checks
+        # one out for a single request and returns it afterwards (http.client
+        # connections are not thread-safe), so the pool is bounded by the number of
+        # concurrent requests rather than by the threads that ever ran one. urlopen
+        # is used instead when a proxy is configured, since only it honours the
+        # proxy environment variables.
+        self._keep_alive = not urllib.request.getproxies()
+        self._idle: defaultdict[tuple[str, str], list[http.client.HTTPConnection]] = (
+            defaultdict(list)
+        )
+        self._idle_lock = threading.Lock()
 
     async def fetch(self, url: str) -> tuple[bytes, dict[str, Any]]:
         """Fetch a URL respecting rate limits and retrying 429/5xx."""
@@ -82,14 +109,15 @@ class SECClient:
     async def fetch_json(self, url: str) -> tuple[dict[str, Any], dict[str, Any]]:
         """Fetch and parse JSON from URL."""
         content, headers = await self.fetch(url)
-        try:
-            return json.loads(content.decode("utf-8")), headers
-        except UnicodeDecodeError:
-            return json.loads(content.decode("latin-1")), headers
+        return parse_json(content), headers
 
     async def close(self) -> None:
-        """Compatibility no-op (stdlib client has no persistent resources)."""
-        return
+        """Close idle kept-alive connections."""
+        with self._idle_lock:
+            pools, self._idle = self._idle, defaultdict(list)
+        for pool in pools.values():
+            for conn in pool:
+                conn.close()
 
     async def __aenter__(self) -> SECClient:
         return self
@@ -103,7 +131,7 @@ class SECClient:
         for attempt in range(1, self._max_retries + 1):
             await self._rate_limiter.acquire()
             try:
-                content, headers, status = await asyncio.to_thread(self._fetch_sync, url)
+                content, headers, status = await self._fetch_once(url)
             except Exception:
                 if attempt >= self._max_retries:
                     raise
@@ -127,7 +155,95 @@ class SECClient:
 
         raise RuntimeError("unreachable")
 
-    def _fetch_sync(self, url: str) -> tuple[bytes, dict[str, str], int]:
+    async def _fetch_once(self, url: str) -> tuple[bytes, dict[str, str], int]:
+        try:
+            return await asyncio.to_thread(self._fetch_sync, url)
+        except _StaleConnectionError:
+            # The server may have closed the idle connection. Resending is a new
+            # request, so it waits for its own rate-limiter slot.
+            await self._rate_limiter.acquire()
+            return await asyncio.to_thread(self._fetch_sync, url, True)
+
+    def _fetch_sync(self, url: str, fresh: bool = False) -> tuple[bytes, dict[str, str], int]:
+        parts = urlsplit(url)
+        if not self._keep_alive or parts.scheme not in ("http", "https") or not parts.hostname:
+            return self._fetch_urlopen(url)
+
+        key = (parts.scheme, parts.netloc)
+        conn = None if fresh else self._checkout(key)
+        reused = conn is not None
+        if conn is None:
+            conn = self._new_connection(parts)
+        try:
+            result, reusable = self._fetch_on(conn, parts)
+        except (http.client.HTTPException, OSError) as e:
+            conn.close()
+            if reused:
+                raise _StaleConnectionError(str(e)) from e
+            raise
+
+        if reusable:
+            self._checkin(key, conn)
+        else:
+            conn.close()
+        if result is None:
+            # Redirect: let urllib follow it.
+            return self._fetch_urlopen(url)
+        return result
+
+    def _checkout(self, key: tuple[str, str]) -> http.client.HTTPConnection | None:
+        """Take an idle connection to the host out of the pool, if there is one."""
+        with self._idle_lock:
+            pool = self._idle.get(key)
+            return pool.pop() if pool else None
+
+    def _checkin(self, key: tuple[str, str], conn: http.client.HTTPConnection) -> None:
+        """Return a connection to the pool, closing it if the pool is full."""
+        with self._idle_lock:
+            pool = self._idle[key]
+            if len(pool) < MAX_IDLE_CONNECTIONS_PER_HOST:
+                pool.append(conn)
+                return
+        conn.close()
+
+    def _new_connection(self, parts: SplitResult) -> http.client.HTTPConnection:
+        timeout = max(float(CONNECT_TIMEOUT), float(READ_TIMEOUT))
+        conn_class = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        return conn_class(parts.hostname, parts.port, timeout=timeout)
+
+    def _fetch_on(
+        self, conn: http.client.HTTPConnection, parts: SplitResult
+    ) -> tuple[tuple[bytes, dict[str, str], int] | None, bool]:
+        """GET over a kept-alive connection.
+
+        Returns:
+            (response, whether the connection can be reused); the response is None
+            for redirects
+        """
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        conn.request(
+            "GET",
+            path,
+            headers={
+                "User-Agent": self.user_agent,
+                "Accept-Encoding": "gzip",
+            },
+        )
+        resp = conn.getresponse()
+        # The body is read in full so the connection can be reused.
+        content = resp.read() or b""
+        status = int(resp.status)
+        headers = {k: v for k, v in resp.getheaders()}
+        reusable = not resp.will_close
+        if status in _REDIRECT_STATUSES:
+            return None, reusable
+        return (_maybe_gunzip(content, headers), headers, status), reusable
+
+    def _fetch_urlopen(self, url: str) -> tuple[bytes, dict[str, str], int]:
         # urllib only has a single timeout, so we pick the larger of connect/read.
         timeout = max(float(CONNECT_TIMEOUT), float(READ_TIMEOUT))
         req = urllib.request.Request(
@@ -156,6 +272,24 @@ class SECClient:
         return _maybe_gunzip(content, headers), headers, status
 
 
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+
+def parse_json(content: bytes) -> Any:
+    """Parse a JSON response body (UTF-8, falling back to Latin-1).
+
+    Args:
+        content: Raw response bytes
+
+    Returns:
+        Parsed JSON
+    """
+    try:
+        return json.loads(content.decode("utf-8"))
+    except UnicodeDecodeError:
+        return json.loads(content.decode("latin-1"))
+
+
 def _maybe_gunzip(content: bytes, headers: dict[str, str]) -> bytes:
     if (headers.get("Content-Encoding") or "").lower() != "gzip":
         return content
@@ -187,3 +321,11 @@ async def get_client() -> SECClient:
     if _global_client is None:
         _global_client = SECClient()
     return _global_client
+
+
+async def close_client() -> None:
+    """Close the global SEC client's connections and drop the instance."""
+    global _global_client
+    client, _global_client = _global_client, None
+    if client is not None:
+        await client.close()
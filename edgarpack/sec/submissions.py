@@ -6,8 +6,8 @@ from typing import Any
 from pydantic import BaseModel
 
 from ..config import CACHE_DIR, SEC_DATA_BASE
-from .cache import DiskCache
-from .client import get_client
+from .cache import get_cache
+from .client import get_client, parse_json
 
 
 class FilingMeta(BaseModel):
@@ -63,23 +63,20 @@ async def fetch_submissions(cik: str, force: bool = False) -> dict[str, Any]:
     cik = normalize_cik(cik)
     url = f"{SEC_DATA_BASE}/submissions/CIK{cik}.json"
 
-    cache = DiskCache(CACHE_DIR)
+    cache = get_cache(CACHE_DIR)
 
     # Use cached version if available and fresh (1 hour)
     if not force:
         cached = cache.get(url, max_age_seconds=3600)
         if cached is not None:
-            import json
-
-            return json.loads(cached)
+            return parse_json(cached)
 
     client = await get_client()
-    data, headers = await client.fetch_json(url)
-
-    # Cache the response
-    import json
+    content, headers = await client.fetch(url)
+    data = parse_json(content)
 
-    cache.put(url, json.dumps(data).encode(), headers)
+    # Cache the response body as received (no re-serialization).
+    cache.put(url, content, headers)
 
     return data
 
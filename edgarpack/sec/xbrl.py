@@ -3,8 +3,8 @@
 from typing import Any
 
 from ..config import CACHE_DIR, SEC_DATA_BASE
-from .cache import DiskCache
-from .client import get_client
+from .cache import get_cache
+from .client import get_client, parse_json
 from .submissions import normalize_cik
 
 
@@ -21,26 +21,25 @@ async def fetch_company_facts(cik: str, force: bool = False) -> dict[str, Any]:
     cik = normalize_cik(cik)
     url = f"{SEC_DATA_BASE}/api/xbrl/companyfacts/CIK{cik}.json"
 
-    cache = DiskCache(CACHE_DIR)
+    cache = get_cache(CACHE_DIR)
 
     if not force:
         # XBRL data changes less frequently, cache for 24 hours
         cached = cache.get(url, max_age_seconds=86400)
         if cached is not None:
-            import json
-
-            return json.loads(cached)
+            return parse_json(cached)
 
     client = await get_client()
     try:
-        data, headers = await client.fetch_json(url)
+        content, headers = await client.fetch(url)
+        data = parse_json(content)
     except Exception:
         # XBRL data not available for all companies
         return {}
 
-    import json
-
-    cache.put(url, json.dumps(data).encode(), headers)
+    # Cache the response body as received; companyfacts can run to tens of MB,
+    # so it is not re-serialized.
+    cache.put(url, content, headers)
 
     return data
 
@@ -60,6 +59,13 @@ def filter_facts_by_accession(
     """
     # Normalize accession format (remove dashes for comparison)
     accession_nodash = accession.replace("-", "")
+    # Facts normally carry the canonical dashed form (0000320193-24-000123), which
+    # is compared as-is instead of stripping dashes from every value.
+    accession_dashed = (
+        f"{accession_nodash[:10]}-{accession_nodash[10:12]}-{accession_nodash[12:]}"
+        if len(accession_nodash) == 18
+        else None
+    )
 
     result: dict[str, Any] = {}
 
@@ -87,18 +93,27 @@ def filter_facts_by_accession(
                         continue
 
                     # Check if this fact is from our target filing
-                    value_accession = value.get("accn", "").replace("-", "")
-                    if value_accession == accession_nodash:
-                        # Include relevant fields
-                        matching_values.append(
-                            {
-                                "period": _format_period(value),
-                                "value": value.get("val"),
-                                "unit": unit_type,
-                                "form": value.get("form"),
-                                "frame": value.get("frame"),
-                            }
-                        )
+                    value_accession = value.get("accn", "")
+                    if value_accession != accession_dashed:
+                        if accession_dashed is not None and _is_canonical_accession(
+                            value_accession
+                        ):
+                            # A different canonical accession can't match once its
+                            # dashes are removed either.
+                            continue
+                        if value_accession.replace("-", "") != accession_nodash:
+                            continue
+
+                    # Include relevant fields
+                    matching_values.append(
+                        {
+                            "period": _format_period(value),
+                            "value": value.get("val"),
+                            "unit": unit_type,
+                            "form": value.get("form"),
+                            "frame": value.get("frame"),
+                        }
+                    )
 
                 if matching_values:
                     if concept_name not in taxonomy_result:
@@ -111,6 +126,11 @@ def filter_facts_by_accession(
     return result
 
 
+def _is_canonical_accession(value: str) -> bool:
+    """Return True for the dashed form 0000320193-24-000123 (dashes at 10 and 13)."""
+    return len(value) == 20 and value[10] == "-" and value[13] == "-"
+
+
 def _format_period(value: dict[str, Any]) -> str:
     """Format period from XBRL fact.
 
@@ -1,8 +1,15 @@
 """Tests for SEC archives helpers."""
 
+import asyncio
+import tempfile
 import unittest
+from datetime import date
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from edgarpack.sec import archives
 from edgarpack.sec.archives import identify_html_files
+from edgarpack.sec.submissions import FilingMeta
 
 
 class TestIdentifyHtmlFiles(unittest.TestCase):
@@ -36,6 +43,73 @@ class TestIdentifyHtmlFiles(unittest.TestCase):
         files = identify_html_files(index, primary_doc="doc.htm")
         self.assertEqual(files, ["doc.htm"])
 
+    def test_skips_rendering_and_exhibit_files(self) -> None:
+        index = {
+            "directory": {
+                "item": [
+                    {"name": "R2.htm"},
+                    {"name": "EX21.htm"},
+                    {"name": "index-headers.html"},
+                    {"name": "annual.htm"},
+                    {"name": "report.xml"},
+                    {"name": "doc.htm"},
+                ]
+            }
+        }
+        files = identify_html_files(index, primary_doc="doc.htm")
+        self.assertEqual(files, ["doc.htm", "annual.htm"])
+
+
+class TestFetchFilingIndex(unittest.TestCase):
+    def test_caches_response_body_as_received(self) -> None:
+        meta = FilingMeta(
+            cik="0000000001",
+            accession="0000000001-24-000001",
+            form_type="10-K",
+            filing_date=date(2024, 1, 2),
+            primary_document="doc.htm",
+            company_name="Example Corp",
+        )
+        body = b'{"directory": {"item": [{"name": "doc.htm"}]}}'
+        client = MagicMock()
+        client.fetch = AsyncMock(return_value=(body, {}))
+
+        with tempfile.TemporaryDirectory() as td:
+            with (
+                patch.object(archives, "CACHE_DIR", Path(td)),
+                patch.object(archives, "get_client", AsyncMock(return_value=client)),
+            ):
+                index = asyncio.run(archives.fetch_filing_index(meta))
+                cached = archives.get_cache(Path(td)).get(
+                    f"{archives.SEC_ARCHIVES_BASE}/0000000001/000000000124000001/index.json"
+                )
+                again = asyncio.run(archives.fetch_filing_index(meta))
+
+        self.assertEqual(index, {"directory": {"item": [{"name": "doc.htm"}]}})
+        self.assertEqual(cached, body)
+        self.assertEqual(again, index)
+        client.fetch.assert_awaited_once()
+
+
+class TestFetchFilingHtml(unittest.TestCase):
+    def test_keeps_order_and_warns_on_failed_files(self) -> None:
+        meta = MagicMock(primary_document="doc.htm")
+        index = {"directory": {"item": [{"name": "b.htm"}, {"name": "a.htm"}]}}
+
+        async def fake_fetch_file(meta: object, filename: str, force: bool = False) -> bytes:
+            if filename == "a.htm":
+                raise OSError("missing")
+            return filename.encode()
+
+        with (
+            patch.object(archives, "fetch_filing_index", AsyncMock(return_value=index)),
+            patch.object(archives, "fetch_file", fake_fetch_file),
+        ):
+            with self.assertWarnsRegex(UserWarning, "Failed to fetch a.htm"):
+                results = asyncio.run(archives.fetch_filing_html(meta))
+
+        self.assertEqual(results, [("doc.htm", b"doc.htm"), ("b.htm", b"b.htm")])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,32 @@
+"""Tests for the SEC response disk cache."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from edgarpack.sec.cache import get_cache
+
+
+class TestDiskCache(unittest.TestCase):
+    def test_put_get_clear_roundtrip(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            cache = get_cache(Path(td))
+            url = "https://www.sec.gov/Archives/edgar/data/1/2/doc.htm"
+
+            self.assertIsNone(cache.get(url))
+            cache.put(url, b"<html></html>", {"Content-Type": "text/html"})
+            self.assertTrue(cache.exists(url))
+            self.assertEqual(cache.get(url), b"<html></html>")
+            self.assertEqual(cache.get(url, max_age_seconds=3600), b"<html></html>")
+
+            self.assertTrue(cache.clear(url))
+            self.assertFalse(cache.exists(url))
+            self.assertFalse(cache.clear(url))
+
+    def test_get_cache_is_shared_per_directory(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            self.assertIs(get_cache(Path(td)), get_cache(Path(td)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""Tests for the SEC HTTP client."""
+
+import asyncio
+import gzip
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import urlsplit
+
+from edgarpack.config import MAX_IDLE_CONNECTIONS_PER_HOST
+from edgarpack.sec.client import HTTPError, SECClient, close_client, get_client
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: set[int] = set()
+
+    def do_GET(self) -> None:  # noqa: N802 - BaseHTTPRequestHandler API
+        type(self).connections.add(self.client_address[1])
+        if self.path == "/old":
+            self._send(301, b"", {"Location": "/doc.htm"})
+        elif self.path == "/doc.htm":
+            self._send(200, gzip.compress(b"<html>doc</html>"), {"Content-Encoding": "gzip"})
+        else:
+            self._send(404, b"not found", {})
+
+    def _send(self, status: int, body: bytes, headers: dict[str, str]) -> None:
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+
+class TestSECClient(unittest.TestCase):
+    def setUp(self) -> None:
+        _Handler.connections = set()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _client(self) -> SECClient:
+        with patch("urllib.request.getproxies", return_value={}):
+            return SECClient(user_agent="test test@example.com", rate_limit=100, max_retries=1)
+
+    def test_reuses_connection_and_decodes_gzip(self) -> None:
+        client = self._client()
+        results = [client._fetch_sync(f"{self.base}/doc.htm") for _ in range(3)]
+        asyncio.run(client.close())
+
+        self.assertEqual([content for content, _, _ in results], [b"<html>doc</html>"] * 3)
+        self.assertEqual({status for _, _, status in results}, {200})
+        # One connection served all three requests.
+        self.assertEqual(len(_Handler.connections), 1)
+
+    def test_pools_connections_across_threads(self) -> None:
+        client = self._client()
+        for _ in range(3):
+            # Each worker thread is new, as with a fresh executor per asyncio.run.
+            worker = threading.Thread(target=client._fetch_sync, args=(f"{self.base}/doc.htm",))
+            worker.start()
+            worker.join()
+
+        self.assertEqual(len(_Handler.connections), 1)
+        self.assertEqual(sum(len(pool) for pool in client._idle.values()), 1)
+        asyncio.run(client.close())
+        self.assertEqual(sum(len(pool) for pool in client._idle.values()), 0)
+
+    def test_idle_pool_is_bounded(self) -> None:
+        client = self._client()
+        key = ("http", self.base.removeprefix("http://"))
+        conns = [client._new_connection(urlsplit(self.base)) for _ in range(10)]
+        for conn in conns:
+            client._checkin(key, conn)
+        self.assertEqual(len(client._idle[key]), MAX_IDLE_CONNECTIONS_PER_HOST)
+
+    def test_stale_connection_retry_takes_rate_limit_slot(self) -> None:
+        client = self._client()
+        client._fetch_sync(f"{self.base}/doc.htm")
+        # Simulate the server dropping the idle connection.
+        (conn,) = next(iter(client._idle.values()))
+        conn.sock.close()
+
+        async def run() -> bytes:
+            with patch.object(
+                client._rate_limiter, "acquire", wraps=client._rate_limiter.acquire
+            ) as acquire:
+                content, _ = await client.fetch(f"{self.base}/doc.htm")
+            self.assertEqual(acquire.await_count, 2)
+            await client.close()
+            return content
+
+        self.assertEqual(asyncio.run(run()), b"<html>doc</html>")
+
+    def test_close_client_drops_global_instance(self) -> None:
+        async def run() -> None:
+            first = await get_client()
+            await close_client()
+            self.assertIsNot(await get_client(), first)
+            await close_client()
+
+        asyncio.run(run())
+
+    def test_follows_redirects_and_raises_for_errors(self) -> None:
+        client = self._client()
+
+        async def run() -> bytes:
+            async with client:
+                content, _ = await client.fetch(f"{self.base}/old")
+                with self.assertRaises(HTTPError) as ctx:
+                    await client.fetch(f"{self.base}/missing")
+                self.assertEqual(ctx.exception.status_code, 404)
+                return content
+
+        self.assertEqual(asyncio.run(run()), b"<html>doc</html>")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+"""Tests for JSON serialization helpers."""
+
+import json
+import unittest
+from unittest.mock import patch
+
+from edgarpack import fastjson
+from edgarpack.fastjson import dumps_sorted
+
+
+class TestDumpsSorted(unittest.TestCase):
+    DATA = {
+        "facts": {"us-gaap": {"Revenues": [{"value": 1.5, "unit": "USD"}]}},
+        "company": "Société Générale",
+        "empty": {},
+        "list": [],
+        "big": 2**70,
+    }
+
+    def test_sorted_indented_utf8(self) -> None:
+        out = dumps_sorted(self.DATA)
+        self.assertTrue(out.startswith(b'{\n  "big"'))
+        self.assertIn("Société".encode(), out)
+        self.assertEqual(json.loads(out), self.DATA)
+
+    def test_stdlib_fallback_matches_fast_path(self) -> None:
+        data = {k: v for k, v in self.DATA.items() if k != "big"}
+        with patch.object(fastjson, "orjson", None):
+            fallback = dumps_sorted(data)
+        self.assertEqual(dumps_sorted(data), fallback)
+
+    def test_matches_stdlib_on_exponent_floats_and_non_ascii(self) -> None:
+        data = {"par": 1e-7, "shares": 1e16, "eps": 1.5e300, "label": "Nestlé 1e5 ☃", "n": 3}
+        for ensure_ascii in (False, True):
+            expected = json.dumps(data, indent=2, sort_keys=True, ensure_ascii=ensure_ascii)
+            with patch.object(fastjson, "orjson", None):
+                fallback = dumps_sorted(data, ensure_ascii=ensure_ascii)
+            self.assertEqual(fallback, expected.encode())
+            self.assertEqual(dumps_sorted(data, ensure_ascii=ensure_ascii), expected.encode())
+
+
+if __name__ == "__main__":
+    unittest.main()
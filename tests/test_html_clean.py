@@ -1,8 +1,17 @@
 """Tests for HTML cleaning."""
 
 import unittest
+from html.parser import HTMLParser
 
-from edgarpack.parse.html_clean import clean_html, extract_text, is_hidden_element, is_hidden_style
+from edgarpack.parse.html_clean import (
+    _CleaningHTMLParser,
+    clean_html,
+    extract_text,
+    is_hidden_element,
+    is_hidden_style,
+)
+from edgarpack.parse.ixbrl_strip import strip_ixbrl
+from edgarpack.parse.semantic_html import reduce_to_semantic, simplify_html
 
 
 class TestCleanHTML(unittest.TestCase):
@@ -96,5 +105,86 @@ class TestExtractText(unittest.TestCase):
         self.assertNotIn("var x", text)
 
 
+class TestCleaningParserUpdatepos(unittest.TestCase):
+    """Pins the private ParserBase.updatepos contract that the cleaner overrides."""
+
+    HTML = (
+        '<html><body><!-- note --><p class="x">A &amp; B\n</p><script>x<y</script>'
+        "<br/><?pi?><!DOCTYPE html><table><tr><td>1</td></tr></table>tail"
+    )
+
+    def test_called_with_contiguous_spans(self) -> None:
+        calls: list[tuple[int, int]] = []
+
+        class _Recording(_CleaningHTMLParser):
+            def updatepos(self, i: int, j: int) -> int:
+                calls.append((i, j))
+                return super().updatepos(i, j)
+
+        parser = _Recording()
+        parser.feed(self.HTML)
+        parser.close()
+
+        # Every consumed token is reported, in order, from the start to the end.
+        self.assertTrue(calls)
+        self.assertEqual(calls[0][0], 0)
+        self.assertEqual(calls[-1][1], len(self.HTML))
+        for (_, prev_end), (start, _) in zip(calls, calls[1:]):
+            self.assertEqual(start, prev_end)
+
+    def test_output_matches_base_updatepos(self) -> None:
+        class _BasePositions(_CleaningHTMLParser):
+            updatepos = HTMLParser.updatepos
+
+        outputs = []
+        for parser in (_CleaningHTMLParser(), _BasePositions()):
+            parser.feed(self.HTML)
+            parser.close()
+            outputs.append("".join(parser.out))
+        self.assertEqual(outputs[0], outputs[1])
+
+
+class TestReduceToSemantic(unittest.TestCase):
+    def test_renames_and_unwraps_tags(self) -> None:
+        html = '<B>Bold</B> <samp>x</samp> <font size="2">plain</font> <s>old</ s><br>'
+        self.assertEqual(
+            reduce_to_semantic(html),
+            "<strong>Bold</strong> <code>x</code> plain old<br>",
+        )
+
+
+class TestSimplifyHTML(unittest.TestCase):
+    def test_matches_sequential_pipeline(self) -> None:
+        html = (
+            '<html xmlns:ix="http://www.xbrl.org/2013/inlineXBRL"><body>'
+            '<div style="display:none"><ix:header>hidden</ix:header></div>'
+            '<p class="x">Revenue: <ix:nonFraction name="us-gaap:Revenues" contextRef="c">'
+            "<b>119,575</b></ix:nonFraction></p>"
+            '<font>See <a href="exhibit.htm">Exhibit</a> and <a href="javascript:void(0)">'
+            "this</a>.</font><center><strong>Total</strong></center>"
+            "</body></html>"
+        )
+        base_url = "https://www.sec.gov/Archives/edgar/data/1/2/"
+        expected = reduce_to_semantic(clean_html(strip_ixbrl(html)), base_url=base_url)
+        self.assertEqual(simplify_html(html, base_url=base_url), expected)
+        self.assertIn(f'href="{base_url}exhibit.htm"', expected)
+        self.assertNotIn("ix:", expected)
+
+    def test_matches_sequential_pipeline_whitespace(self) -> None:
+        base_url = "https://www.sec.gov/Archives/edgar/data/1/2/"
+        fixtures = [
+            "<p>Net <font> sales </font>\n <small>rose</small> <b>8%</b></p>",
+            "<div> <center>\n<u>Total</u> </center> </div>\t<s>old</s>",
+            '<p>See <a href="javascript:void(0)"> here </a> and <a href=" ">there</a>.</p>',
+            '<p><a href="a \n  b.htm">\tlink </a> <a href="#top"> top</a></p>',
+            '<font size="2">\n\n\n<ix:nonNumeric name="dei:X"> <i>x</i> </ix:nonNumeric></font>',
+        ]
+        for html in fixtures:
+            for base in (None, base_url):
+                with self.subTest(html=html, base_url=base):
+                    expected = reduce_to_semantic(clean_html(strip_ixbrl(html)), base_url=base)
+                    self.assertEqual(simplify_html(html, base_url=base), expected)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -57,6 +57,21 @@ class TestStripIXBRL(unittest.TestCase):
         self.assertIn("10-K", result)
         self.assertIn("100", result)
 
+    def test_collapses_spaces_joined_by_removed_tags(self) -> None:
+        html = (
+            '<p xmlns:ix="http://www.xbrl.org/2013/inlineXBRL">Net '
+            '<ix:nonFraction name="a"> 5 </ix:nonFraction>  million</p>'
+        )
+        self.assertEqual(strip_ixbrl(html), "<p>Net 5 million</p>")
+
+    def test_plain_html_only_collapses_spaces(self) -> None:
+        html = "<p>Plain  filing   text</p>"
+        self.assertEqual(strip_ixbrl(html), "<p>Plain filing text</p>")
+
+    def test_strips_mixed_case_tags_without_declarations(self) -> None:
+        html = "<p>Net <IX:NonFraction>5</IX:NonFraction>  and <Dei:X>6</Dei:X> ix: text</p>"
+        self.assertEqual(strip_ixbrl(html), "<p>Net 5 and 6 ix: text</p>")
+
     def test_strips_declared_xbrl_prefixes(self) -> None:
         html = '<html xmlns:foo="http://xbrl.org/2003/instance"><foo:bar>123</foo:bar></html>'
         result = strip_ixbrl(html)
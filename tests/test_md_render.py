@@ -2,7 +2,10 @@
 
 import unittest
 
-from edgarpack.parse.md_render import _normalize_output, render_markdown
+from edgarpack.parse.html_clean import clean_html
+from edgarpack.parse.ixbrl_strip import strip_ixbrl
+from edgarpack.parse.md_render import _normalize_output, parse_filing, render_markdown
+from edgarpack.parse.semantic_html import reduce_to_semantic
 
 
 class TestRenderMarkdown(unittest.TestCase):
@@ -56,6 +59,47 @@ class TestRenderMarkdown(unittest.TestCase):
         self.assertIn("Two", md)
         self.assertNotIn("OneTwo", md)
 
+    def test_renders_many_line_breaks(self) -> None:
+        md = render_markdown("<div>" + "line<br>" * 5000 + "</div>")
+        self.assertEqual(md.count("line"), 5000)
+        self.assertNotIn("<br>", md)
+
+
+class TestParseFiling(unittest.TestCase):
+    FIXTURES = [
+        (
+            '<html xmlns:ix="http://www.xbrl.org/2013/inlineXBRL"><body>'
+            '<h2>ITEM 1. BUSINESS</h2><div style="display:none">hidden</div>'
+            '<p>Revenue <ix:nonFraction name="us-gaap:Revenues">1,000</ix:nonFraction>'
+            ' <a href="/doc.htm">link</a></p></body></html>'
+        ),
+        "<p>Net <font> sales </font>\n <b>rose</b> <small>8%</small> <i> in </i>2024</p>",
+        "<div> <center><u>Total</u> </center>\t<s>old</s> <strong>new</strong></div>",
+        (
+            '<p>See <a href="javascript:void(0)"> here </a>, <a href=" ">there</a> and'
+            ' <a href="#top">top</a>.</p><ul><li> <b>One</b> </li><li>Two</li></ul>'
+        ),
+        (
+            "<table><tr><th> Year </th><th><font>Amount</font></th></tr>"
+            "<tr><td>2024</td><td> <b>$ 1,234</b> </td></tr></table>"
+        ),
+    ]
+
+    def test_matches_staged_pipeline(self) -> None:
+        for html in self.FIXTURES:
+            for base_url in (None, "https://www.sec.gov/Archives/edgar/data/1/2/"):
+                with self.subTest(html=html, base_url=base_url):
+                    staged = render_markdown(
+                        reduce_to_semantic(clean_html(strip_ixbrl(html)), base_url=base_url)
+                    )
+                    self.assertEqual(parse_filing(html, base_url=base_url), staged)
+
+    def test_strips_ixbrl_and_hidden_content(self) -> None:
+        md = parse_filing(self.FIXTURES[0], base_url="https://example.test/")
+        self.assertIn("Revenue 1,000", md)
+        self.assertIn("[link](https://example.test/doc.htm)", md)
+        self.assertNotIn("hidden", md)
+
 
 class TestNormalizeOutput(unittest.TestCase):
     def test_collapses_multiple_blank_lines(self) -> None:
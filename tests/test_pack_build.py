@@ -3,14 +3,30 @@
 from __future__ import annotations
 
 import json
+import os
 import tempfile
 import unittest
 from datetime import UTC, date, datetime
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
-from edgarpack.pack.chunks import chunk_section
-from edgarpack.pack.manifest import compute_sha256, create_manifest, write_manifest
+from edgarpack.fastjson import dumps_sorted
+from edgarpack.pack.chunks import (
+    chunk_section,
+    generate_chunk_id,
+    generate_chunks,
+    write_and_hash_chunks,
+    write_chunks_ndjson,
+)
+from edgarpack.pack.llms_txt import scan_filings_for_company_llms
+from edgarpack.pack.manifest import (
+    compute_file_sha256,
+    compute_sha256,
+    create_manifest,
+    read_summary,
+    write_manifest,
+    write_summary,
+)
 from edgarpack.sec.submissions import FilingMeta
 
 
@@ -26,6 +42,12 @@ class TestComputeSha256(unittest.TestCase):
         content = "test content for hashing"
         self.assertEqual(compute_sha256(content), compute_sha256(content))
 
+    def test_file_hash_matches_content_hash(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "a.md"
+            path.write_bytes("Caf\u00e9\n".encode() * 1000)
+            self.assertEqual(compute_file_sha256(path), compute_sha256(path.read_bytes()))
+
 
 class TestManifestDeterminism(unittest.TestCase):
     def test_create_manifest_uses_stable_timestamp(self) -> None:
@@ -58,6 +80,36 @@ class TestManifestDeterminism(unittest.TestCase):
         self.assertEqual(manifest.generated_at, expected)
         self.assertEqual(manifest.source.fetched_at, expected)
 
+    def test_approximate_section_tokens(self) -> None:
+        meta = FilingMeta(
+            cik="0000000001",
+            accession="0000000001-24-000001",
+            form_type="10-Q",
+            filing_date=date(2024, 1, 15),
+            primary_document="doc.htm",
+            company_name="Test Co",
+        )
+
+        class _S:
+            id = "unknown_01"
+            title = "Unknown"
+            content = "Body text " * 10
+            char_start = 0
+            char_end = 100
+
+        manifest = create_manifest(
+            filing_meta=meta,
+            sections=[_S()],
+            artifacts={},
+            warnings=[],
+            tokens_total=25,
+            source_url="https://example.test",
+            approximate=True,
+        )
+
+        self.assertEqual(manifest.sections[0].tokens_approx, 25)
+        self.assertEqual(manifest.sections[0].sha256, compute_sha256(_S.content))
+
     def test_write_manifest_is_byte_stable(self) -> None:
         meta = FilingMeta(
             cik="0000000001",
@@ -93,8 +145,77 @@ class TestManifestDeterminism(unittest.TestCase):
             self.assertEqual(b1, b2)
             self.assertTrue(b1.endswith(b"\n"))
 
+    def test_summary_is_only_trusted_while_manifest_matches(self) -> None:
+        meta = FilingMeta(
+            cik="0000000001",
+            accession="0000000001-24-000001",
+            form_type="10-Q",
+            filing_date=date(2024, 1, 15),
+            primary_document="doc.htm",
+            company_name="Test Co",
+        )
+
+        class _S:
+            id = "unknown_01"
+            title = "Unknown"
+            content = "Body"
+            char_start = 0
+            char_end = 4
+
+        manifest = create_manifest(
+            filing_meta=meta,
+            sections=[_S()],
+            artifacts={"filing.full.md": compute_sha256("Body")},
+            warnings=[],
+            tokens_total=1,
+            source_url="https://example.test",
+        )
+
+        with tempfile.TemporaryDirectory() as td:
+            out = Path(td)
+            manifest_path = write_manifest(manifest, out)
+            write_summary(manifest, out)
+            summary = read_summary(out)
+            assert summary is not None
+            self.assertEqual(summary["tokens_total"], 1)
+            self.assertEqual(summary["artifacts"], ["filing.full.md"])
+
+            # An edited manifest wins over the stale sidecar.
+            data = json.loads(manifest_path.read_text("utf-8"))
+            data["tokens_total"] = 7
+            data["artifacts"]["llms.txt"] = compute_sha256("x")
+            manifest_path.write_text(json.dumps(data), encoding="utf-8")
+            summary = read_summary(out)
+            assert summary is not None
+            self.assertEqual(summary["tokens_total"], 7)
+            self.assertEqual(summary["artifacts"], ["filing.full.md", "llms.txt"])
+
+            # A same-size edit is caught by the modification time.
+            write_manifest(manifest, out)
+            write_summary(manifest, out)
+            data = json.loads(manifest_path.read_text("utf-8"))
+            data["tokens_total"] = 9
+            stat = manifest_path.stat()
+            manifest_path.write_bytes(dumps_sorted(data) + b"\n")
+            self.assertEqual(manifest_path.stat().st_size, stat.st_size)
+            os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            summary = read_summary(out)
+            assert summary is not None
+            self.assertEqual(summary["tokens_total"], 9)
+
+            # Without a manifest the directory is not a pack, summary or not.
+            manifest_path.unlink()
+            self.assertTrue((out / "summary.json").exists())
+            self.assertIsNone(read_summary(out))
+
 
 class TestChunkSection(unittest.TestCase):
+    def test_chunk_id_is_stable(self) -> None:
+        # chunk_id is a public join key; this value is from the original derivation.
+        text = "  Risk  Factors\n\nOur business IS risky.  "
+        chunk_id = generate_chunk_id("10k_parti_item1a_risk_factors", 2, text)
+        self.assertEqual(chunk_id, "1c3153b5603dee0f")
+
     def test_small_section_single_chunk(self) -> None:
         content = "This is a small section."
         chunks = chunk_section("sec1", content, min_tokens=1, max_tokens=5000)
@@ -133,6 +254,99 @@ class TestChunkSection(unittest.TestCase):
         self.assertLessEqual(chunks[0].tokens, max_tokens)
 
 
+class _ByteEncoding:
+    """Stand-in for a tiktoken encoding with one token per UTF-8 byte."""
+
+    def encode(self, text: str) -> list[int]:
+        return list(text.encode("utf-8"))
+
+    def decode(self, tokens: list[int]) -> str:
+        return bytes(tokens).decode("utf-8", errors="replace")
+
+
+class TestChunkSectionWithEncoder(unittest.TestCase):
+    def setUp(self) -> None:
+        for target, value in (("tiktoken", object()), ("_encoding", _ByteEncoding)):
+            patcher = patch(f"edgarpack.parse.tokenize.{target}", value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _spans(self, content: str, max_tokens: int) -> list[tuple[int, int, int]]:
+        chunks = chunk_section("sec1", content, min_tokens=1, max_tokens=max_tokens)
+        self.assertEqual("".join(c.text for c in chunks), content)
+        return [(c.char_start, c.char_end, c.tokens) for c in chunks]
+
+    def test_ends_at_last_boundary_within_token_limit(self) -> None:
+        self.assertEqual(
+            self._spans("Aaaa. Bbbb.\n\nCccc. Dd", 7),
+            [(0, 6, 6), (6, 13, 7), (13, 19, 6), (19, 21, 2)],
+        )
+
+    def test_hard_splits_without_boundaries(self) -> None:
+        self.assertEqual(self._spans("abcdefghij", 4), [(0, 4, 4), (4, 8, 4), (8, 10, 2)])
+
+    def test_hard_split_inside_multibyte_character(self) -> None:
+        # The limit falls inside a character; it stays whole (never a U+FFFD
+        # fragment), so the chunk carries its extra byte token.
+        spans = self._spans("\u00e9" * 6, 5)
+        self.assertEqual(spans, [(0, 3, 6), (3, 6, 6)])
+
+
+class TestGenerateChunks(unittest.TestCase):
+    def test_streams_chunks_to_ndjson(self) -> None:
+        class _S:
+            def __init__(self, id: str, content: str) -> None:
+                self.id = id
+                self.content = content
+
+        sections = [_S("a", "First section."), _S("b", "Second section.")]
+        chunks = generate_chunks(sections)
+        self.assertFalse(isinstance(chunks, list))
+
+        with tempfile.TemporaryDirectory() as td:
+            path = write_chunks_ndjson(chunks, Path(td))
+            lines = path.read_text("utf-8").splitlines()
+
+        records = [json.loads(line) for line in lines]
+        self.assertEqual([r["section_id"] for r in records], ["a", "b"])
+        self.assertEqual(records[1]["text"], "Second section.")
+
+    def test_hash_matches_written_bytes(self) -> None:
+        class _S:
+            id = "a"
+            content = "Caf\u00e9 first.\n\nSecond paragraph."
+
+        with tempfile.TemporaryDirectory() as td:
+            digest = write_and_hash_chunks(generate_chunks([_S()]), Path(td))
+            path = Path(td) / "optional" / "chunks.ndjson"
+            self.assertEqual(digest, compute_file_sha256(path))
+            self.assertIn("Caf\u00e9", path.read_text("utf-8"))
+
+
+class TestScanFilingsForCompanyLlms(unittest.TestCase):
+    def test_reads_filing_block_and_sorts_newest_first(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            cik_dir = Path(td)
+            for accession, filing_date in [("a-1", "2023-02-01"), ("a-2", "2024-02-01")]:
+                (cik_dir / accession).mkdir()
+                manifest = {
+                    "artifacts": {"filing.full.md": "x"},
+                    "filing": {"form_type": "10-K", "filing_date": filing_date},
+                    "sections": [{"id": "s", "title": '"filing": {}'}],
+                }
+                (cik_dir / accession / "manifest.json").write_text(
+                    json.dumps(manifest, indent=2, sort_keys=True)
+                )
+            (cik_dir / "not-a-pack").mkdir()
+            (cik_dir / "llms.txt").write_text("x")
+
+            filings = scan_filings_for_company_llms(cik_dir)
+
+        self.assertEqual([f["accession"] for f in filings], ["a-2", "a-1"])
+        self.assertEqual(filings[0]["filing_date"], "2024-02-01")
+        self.assertEqual(filings[0]["form_type"], "10-K")
+
+
 class TestBuildPackDeterminism(unittest.IsolatedAsyncioTestCase):
     async def test_build_pack_deterministic_files(self) -> None:
         from edgarpack.pack.build import build_pack
@@ -195,6 +409,110 @@ class TestBuildPackDeterminism(unittest.IsolatedAsyncioTestCase):
         manifest = json.loads(a["manifest"].decode("utf-8"))
         self.assertIn("llms.txt", manifest.get("artifacts", {}))
 
+    async def test_build_pack_artifact_hashes_match_files(self) -> None:
+        from edgarpack.pack.build import build_pack
+
+        meta = FilingMeta(
+            cik="0000000001",
+            accession="0000000001-24-000001",
+            form_type="10-K",
+            filing_date=date(2024, 1, 15),
+            primary_document="doc.htm",
+            company_name="Test Co",
+        )
+        html = (
+            b"<html><body><h2>ITEM 1. BUSINESS</h2><p>Caf\xc3\xa9 A.</p>"
+            b"<h2>ITEM 2. PROPERTIES</h2><p>B.</p></body></html>"
+        )
+
+        with tempfile.TemporaryDirectory() as td:
+            tmp = Path(td)
+            with (
+                patch(
+                    "edgarpack.pack.build.get_filing_by_accession",
+                    new=AsyncMock(return_value=meta),
+                ),
+                patch(
+                    "edgarpack.pack.build.fetch_filing_html",
+                    new=AsyncMock(return_value=[("doc.htm", html)]),
+                ),
+            ):
+                result = await build_pack(
+                    cik=meta.cik,
+                    accession=meta.accession,
+                    out_dir=tmp,
+                    with_chunks=True,
+                    force=True,
+                )
+                rebuilt = await build_pack(cik=meta.cik, accession=meta.accession, out_dir=tmp)
+
+            self.assertEqual(rebuilt.warnings, ["Pack already exists, use --force to rebuild"])
+            self.assertEqual(rebuilt.sections_count, result.sections_count)
+            self.assertEqual(rebuilt.tokens_total, result.tokens_total)
+            self.assertEqual(rebuilt.filing_meta, result.filing_meta)
+
+            manifest = json.loads((result.output_dir / "manifest.json").read_text("utf-8"))
+            artifacts = manifest["artifacts"]
+            self.assertEqual(rebuilt.artifacts, list(artifacts))
+            self.assertIn("optional/chunks.ndjson", artifacts)
+            self.assertEqual(list(artifacts), sorted(artifacts))
+            for name, digest in artifacts.items():
+                self.assertEqual(
+                    digest, compute_sha256((result.output_dir / name).read_bytes()), name
+                )
+            for section in manifest["sections"]:
+                self.assertEqual(section["sha256"], artifacts[section["path"]])
+
+    async def test_build_pack_approximate_tokens_skips_tokenizer(self) -> None:
+        from edgarpack.pack.build import build_pack
+        from edgarpack.parse.tokenize import estimate_tokens
+
+        meta = FilingMeta(
+            cik="0000000001",
+            accession="0000000001-24-000001",
+            form_type="10-K",
+            filing_date=date(2024, 1, 15),
+            primary_document="doc.htm",
+            company_name="Test Co",
+        )
+        html = (
+            b"<html><body><h2>ITEM 1. BUSINESS</h2><p>Widgets and services.</p>"
+            b"<h2>ITEM 2. PROPERTIES</h2><p>Offices.</p></body></html>"
+        )
+
+        with tempfile.TemporaryDirectory() as td:
+            tmp = Path(td)
+            count_tokens = Mock(side_effect=AssertionError("tokenizer should not run"))
+            with (
+                patch(
+                    "edgarpack.pack.build.get_filing_by_accession",
+                    new=AsyncMock(return_value=meta),
+                ),
+                patch(
+                    "edgarpack.pack.build.fetch_filing_html",
+                    new=AsyncMock(return_value=[("doc.htm", html)]),
+                ),
+                patch("edgarpack.pack.build.count_tokens", new=count_tokens),
+                patch("edgarpack.pack.manifest.count_tokens", new=count_tokens),
+            ):
+                result = await build_pack(
+                    cik=meta.cik,
+                    accession=meta.accession,
+                    out_dir=tmp,
+                    force=True,
+                    approximate_tokens=True,
+                )
+
+            count_tokens.assert_not_called()
+            self.assertIn("Token counts are approximate (--approximate-tokens)", result.warnings)
+            markdown = (result.output_dir / "filing.full.md").read_text("utf-8")
+            self.assertEqual(result.tokens_total, estimate_tokens(markdown))
+            manifest = json.loads((result.output_dir / "manifest.json").read_text("utf-8"))
+            self.assertEqual(manifest["tokens_total"], estimate_tokens(markdown))
+            for section in manifest["sections"]:
+                content = (result.output_dir / section["path"]).read_text("utf-8")
+                self.assertEqual(section["tokens_approx"], estimate_tokens(content))
+
 
 if __name__ == "__main__":
     unittest.main()
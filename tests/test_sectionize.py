@@ -13,6 +13,10 @@ class TestSlugify(unittest.TestCase):
         s = slugify("Management's Discussion & Analysis")
         self.assertIn("_", s)
 
+    def test_whitespace_and_non_ascii(self) -> None:
+        self.assertEqual(slugify("  Risk\tFactors (Note 5)  "), "risk_factors_note_5")
+        self.assertEqual(slugify("Caf\u00e9\u00a0Market & Risk"), "caf_market_risk")
+
     def test_truncates_long_text(self) -> None:
         long_text = "This is a very long title that should be truncated"
         result = slugify(long_text, max_len=20)
@@ -96,6 +100,13 @@ class TestFindSections(unittest.TestCase):
         matches = find_sections(md, "8-K/A")
         self.assertTrue(any(m.item == "1.01" for m in matches))
 
+    def test_finds_headings_matched_only_case_insensitively(self) -> None:
+        # re.IGNORECASE matches "\u017f" (long s) as "s"; str.lower() does not.
+        md = "Item 1. Business\nBody text.\n\u017fIGNATURES\nSigned.\n"
+        matches = find_sections(md, "10-K")
+        self.assertEqual([m.item for m in matches], ["1", "other"])
+        self.assertEqual(matches[1].char_pos, md.index("\u017f"))
+
     def test_general_form_uses_bold_headings(self) -> None:
         md = (
             "##### Table of Contents\n\n**PROSPECTUS SUMMARY** Text\n\n**RISK FACTORS** More text\n"
@@ -141,6 +152,16 @@ class TestSectionize(unittest.TestCase):
         ids = [s.id for s in sections]
         self.assertEqual(len(ids), len(set(ids)))
 
+    def test_duplicate_ids_get_numbered_suffixes(self) -> None:
+        md = "".join(f"## ITEM 1. BUSINESS\n\nBody {n}.\n\n" for n in range(3))
+        md += "## ITEM 2. PROPERTIES\n\nBody.\n"
+        sections = sectionize(md, "10-K")
+        base = "10k_item1_business"
+        self.assertEqual(
+            [s.id for s in sections], [base, f"{base}_1", f"{base}_2", "10k_item2_properties"]
+        )
+        self.assertEqual([bool(s.warnings) for s in sections], [False, True, True, False])
+
 
 if __name__ == "__main__":
     unittest.main()
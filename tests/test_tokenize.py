@@ -0,0 +1,69 @@
+"""Tests for token counting and truncation."""
+
+import re
+import unittest
+from unittest.mock import patch
+
+from edgarpack.parse.tokenize import truncate_to_tokens
+
+# cl100k_base's pre-tokenizer, with \p{L} / \p{N} approximated for `re`.
+_CL100K_PATTERN = re.compile(
+    r"(?i:'s|'t|'re|'ve|'m|'ll|'d)|(?:[^\r\n\w]|_)?[^\W\d_]+|\d{1,3}"
+    r"| ?(?:[^\s\w]|_)+[\r\n]*|\s*[\r\n]+|\s+(?!\S)|\s+"
+)
+
+
+class _PretokenEncoding:
+    """Stand-in for a tiktoken encoding with one token per cl100k pre-token.
+
+    BPE never merges across pre-tokens, so this reproduces where real token
+    boundaries can move when text is cut short.
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[str, int] = {}
+        self._pieces: list[str] = []
+
+    def encode(self, text: str) -> list[int]:
+        tokens = []
+        for piece in _CL100K_PATTERN.findall(text):
+            if piece not in self._ids:
+                self._ids[piece] = len(self._pieces)
+                self._pieces.append(piece)
+            tokens.append(self._ids[piece])
+        return tokens
+
+    def decode(self, tokens: list[int]) -> str:
+        return "".join(self._pieces[t] for t in tokens)
+
+
+class TestTruncateToTokens(unittest.TestCase):
+    def setUp(self) -> None:
+        self.encoding = _PretokenEncoding()
+        for target, value in (
+            ("tiktoken", object()),
+            ("_encoding", lambda: self.encoding),
+            # Start with the smallest window so the prefix cut lands inside the text.
+            ("_TRUNCATE_CHARS_PER_TOKEN", 1),
+        ):
+            patcher = patch(f"edgarpack.parse.tokenize.{target}", value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_matches_full_encoding_across_whitespace_runs(self) -> None:
+        texts = [
+            "alpha   beta  gamma    delta",
+            "One.\n\n  Two.\n   \n three  four.\n\n\n five",
+            "Total:  $ 1,234   \n  (net)  \r\n  2024 ,  x  ' s  y",
+            "a \n b \n\n c  \t  d   e.  \n  f",
+        ]
+        for text in texts:
+            full = self.encoding.encode(text)
+            for max_tokens in range(1, len(full) + 2):
+                with self.subTest(text=text, max_tokens=max_tokens):
+                    expected = self.encoding.decode(full[:max_tokens])
+                    self.assertEqual(truncate_to_tokens(text, max_tokens), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""Tests for XBRL companyfacts filtering."""
+
+import unittest
+
+from edgarpack.sec.xbrl import _is_canonical_accession, filter_facts_by_accession
+
+
+class TestFilterFactsByAccession(unittest.TestCase):
+    def test_matches_dashed_and_undashed_accessions(self) -> None:
+        facts = {
+            "facts": {
+                "us-gaap": {
+                    "Revenues": {
+                        "units": {
+                            "USD": [
+                                {"accn": "0000320193-24-000123", "val": 1, "end": "2024-09-28"},
+                                {"accn": "000032019324000123", "val": 2, "end": "2024-09-28"},
+                                {"accn": "0000320193-24-000124", "val": 3, "end": "2024-09-28"},
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+        for accession in ("0000320193-24-000123", "000032019324000123"):
+            filtered = filter_facts_by_accession(facts, accession)
+            values = [v["value"] for v in filtered["us-gaap"]["Revenues"]]
+            self.assertEqual(values, [1, 2])
+
+    def test_matches_non_canonical_dashes(self) -> None:
+        facts = {
+            "facts": {
+                "us-gaap": {
+                    "Revenues": {
+                        "units": {
+                            "USD": [
+                                # 20 characters, but the dashes are not at 10 and 13.
+                                {"accn": "000032019-324-000123", "val": 1, "end": "2024-09-28"},
+                                {"accn": "0000320193-24000123", "val": 2, "end": "2024-09-28"},
+                                {"accn": "000032019-324-000124", "val": 3, "end": "2024-09-28"},
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+        filtered = filter_facts_by_accession(facts, "0000320193-24-000123")
+        self.assertEqual([v["value"] for v in filtered["us-gaap"]["Revenues"]], [1, 2])
+
+    def test_canonical_accession_shape(self) -> None:
+        self.assertTrue(_is_canonical_accession("0000320193-24-000123"))
+        self.assertFalse(_is_canonical_accession("000032019-324-000123"))
+        self.assertFalse(_is_canonical_accession("000032019324000123"))
+
+    def test_no_match_returns_empty(self) -> None:
+        facts = {"facts": {"dei": {"Shares": {"units": {"shares": [{"accn": "x", "val": 1}]}}}}}
+        self.assertEqual(filter_facts_by_accession(facts, "0000320193-24-000123"), {})
+
+
+if __name__ == "__main__":
+    unittest.main()